@@ -7,11 +7,40 @@ It initializes all extensions, registers blueprints and routes,
 sets up the custom manager architecture, and registers CLI commands.
 """
 
-from flask import Flask
-from .config import config, DEFAULT
-from .extensions import db, csrf, login_manager
-from .seed.commands import register_commands
-from flask_migrate import Migrate
+import os
+from flask import Flask, g, request
+from importlib import import_module
+from functools import lru_cache
+from types import MappingProxyType
+
+# Names re-exported from submodules on first access (see '__getattr__').
+# This keeps 'from app import create_app' from eagerly importing the
+# extensions, config and seed modules (and everything they pull in).
+_lazy_imports = {
+    "db": ".extensions",
+    "csrf": ".extensions",
+    "login_manager": ".extensions",
+}
+
+def __getattr__(name: str):
+    """
+    Resolves the lazily re-exported names listed in '_lazy_imports'.
+
+    This allows existing imports such as 'from app import db' to keep
+    working while deferring the import of the module that defines them
+    until the name is actually used.
+
+    Raises:
+        AttributeError: If 'name' is not a lazily exported attribute.
+    """
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the module so '__getattr__' is only hit once per name
+    globals()[name] = value
+    return value
 
 def get_db():
     """
@@ -28,9 +57,70 @@ def get_db():
     """
     from flask import current_app
 
-    if 'sqlalchemy' not in current_app.extensions:
+    # Single lookup on a local binding rather than a membership test followed by a second index.
+    sqlalchemy = current_app.extensions.get("sqlalchemy")
+
+    if sqlalchemy is None:
         raise RuntimeError("SQLAlchemy extension not initialised on the app")
-    return current_app.extensions["sqlalchemy"]
+    return sqlalchemy
+
+def _is_cli() -> bool:
+    """
+    Checks whether the app is being built by the 'flask' command line.
+
+    Flask's CLI sets 'FLASK_RUN_FROM_CLI' before it loads the app, for
+    every command (e.g., 'flask run', 'flask db upgrade', 'flask seed-db').
+
+    Returns:
+        bool: True if running under the 'flask' command, False otherwise.
+    """
+    return os.environ.get("FLASK_RUN_FROM_CLI") == "true"
+
+@lru_cache(maxsize=None)
+def _config_dict(config_class) -> dict:
+    """
+    Collects the settings of a config class into a plain dict.
+
+    The config classes are dataclasses, so this instantiates the class
+    and reads its declared fields via 'to_dict()'. The result is cached,
+    so this only happens once per class rather than once per app built.
+
+    Args:
+        config_class (type): A config class from 'app/config.py'.
+
+    Returns:
+        dict: A mapping of setting names to their values.
+    """
+    return config_class().to_dict()
+
+def _build_managers(app: Flask) -> None:
+    """
+    Imports and attaches the custom manager instances to the app.
+
+    This must be called after 'db.init_app(app)'. The imports are done
+    here (rather than at module level) to avoid circular dependencies
+    and to keep the manager stack out of the module import graph until
+    an app is actually built.
+
+    The DatabaseManager is given this app's own config, so its
+    PasswordManager follows the app's password rules.
+
+    Args:
+        app (Flask): The Flask application instance being configured.
+    """
+    from .helper.classes.core.SessionManager import SessionManager
+    from .helper.classes.core.AuthManager import AuthManager
+    from .helper.classes.database.DatabaseManager import DatabaseManager
+
+    # This is your "Service Locator" pattern.
+    # We attach all managers directly to the 'app' object, making
+    # them accessible via 'current_app.db_manager', etc.
+    app.db_manager = DatabaseManager(app.config)
+    app.session_manager = SessionManager()
+    
+    # The AuthManager shares the ProfileManager's PasswordManager, which the
+    # DatabaseManager always builds, so no fallback instance is needed.
+    app.auth_manager = AuthManager(app.db_manager.profile, app.db_manager.profile.pw_manager)
 
 def create_app(config_key: str):
     """
@@ -45,10 +135,17 @@ def create_app(config_key: str):
     Returns:
         Flask: The configured Flask application instance.
     """
+    from .config import get_config
+    from .extensions import db, csrf, login_manager
+
     # --- 1. Load configuration ---
-    config_settings = config.get(config_key, DEFAULT)
+    config_settings = get_config(config_key)
     app = Flask(__name__)
-    app.config.from_object(config_settings)
+    app.config.update(_config_dict(config_settings))
+
+    # The API responses are small, fixed-shape dicts, so 'jsonify' has no
+    # need to sort their keys on every encode (Flask's default).
+    app.json.sort_keys = False
 
     # --- 2. Initialize Flask extensions ---
     db.init_app(app)
@@ -56,26 +153,7 @@ def create_app(config_key: str):
     login_manager.init_app(app)
     
     # --- 3. Import and attach custom managers ---
-    # These imports are done here to avoid circular dependencies
-    from .helper.classes.routes.RouteInitialiser import RouteInitialiser
-    from .helper.classes.routes.RouteValidator import RouteValidator
-    from .helper.classes.core.SessionManager import SessionManager
-    from .helper.classes.core.AuthManager import AuthManager
-    from .helper.classes.database.ProfileManager import ProfileManager, PasswordManager
-    from .helper.classes.database.DatabaseManager import DatabaseManager
-
-    # This is your "Service Locator" pattern.
-    # We instantiate all managers and attach them directly to the 'app'
-    # object, making them accessible via 'current_app.db_manager', etc.
-    app.db_manager = DatabaseManager(app.config)
-    app.session_manager = SessionManager()
-    
-    # The AuthManager needs the ProfileManager's PasswordManager
-    auth_pw_manager = app.db_manager.profile.pw_manager or PasswordManager(app.config)
-    app.auth_manager = AuthManager(app.db_manager.profile, auth_pw_manager)
-    
-    # Initialize Flask-Migrate for database migrations
-    migrate = Migrate(app, db)
+    _build_managers(app)
 
     # --- 4. Configure Flask-Login ---
     @login_manager.user_loader
@@ -87,23 +165,67 @@ def create_app(config_key: str):
         It uses the 'profile_id' stored in the session to fetch the
         full Profile object.
         
+        The result is memoized on 'g' so repeat calls within the same
+        request don't go back to the database, and static file requests
+        skip the lookup entirely (see 'skip_user_for_static').
+        
         Args:
             profile_id (int): The user's ID (primary key) from the session.
             
         Returns:
             Profile | None: The Profile object if found, otherwise None.
         """
+        # A None key marks a request that never needs the user (static files)
+        cached = g.get("_loaded_user")
+        if cached is not None and (cached[0] is None or cached[0] == profile_id):
+            return cached[1]
+
         db_res = app.db_manager.profile.get_profile_by_id(profile_id)
         is_success = db_res.get("success", False)
+        profile = db_res.get("payload", {}).get("profile") if is_success else None
 
-        if not is_success:
-            return None
+        g._loaded_user = (profile_id, profile)
+        return profile
 
-        return db_res.get("payload", {}).get("profile")
+    from .helper.classes.database.BaseManager import BaseManager
+    static_prefix = f"{app.static_url_path}/"
+
+    @app.before_request
+    def skip_user_for_static() -> None:
+        """
+        Pre-fills the user memo for static file requests so 'load_user'
+        returns None without querying the database.
+
+        Static assets never need the logged-in user, so there is no
+        reason to pay for a Profile lookup on each of them.
+        """
+        if request.path.startswith(static_prefix):
+            g._loaded_user = (None, None)
+
+    @app.before_request
+    def init_db_state() -> None:
+        """
+        Sets up the database session and read cache for the request.
+
+        The managers read both from 'g' on almost every call, so creating
+        them here keeps those reads to a plain attribute lookup. Static
+        file requests never touch the database and are skipped.
+        """
+        if not request.path.startswith(static_prefix):
+            BaseManager.init_request_state()
 
     # --- 5. Register Context Processors ---
+    # The injected values are fixed once the app is configured, so the
+    # mapping is built a single time here instead of on every render.
+    meta_data = MappingProxyType({
+        "SITE_NAME": app.config.get("SITE_NAME"),
+        "SITE_TAGLINE": app.config.get("SITE_TAGLINE"),
+        "PASSWORD_MIN_LENGTH": app.config.get("PASSWORD_MIN_LENGTH"),
+        "PASSWORD_MAX_LENGTH": app.config.get("PASSWORD_MAX_LENGTH")
+    })
+
     @app.context_processor
-    def inject_meta_data() -> dict:
+    def inject_meta_data() -> MappingProxyType:
         """
         Injects global variables into all Jinja2 templates.
         
@@ -111,27 +233,46 @@ def create_app(config_key: str):
         template without having to pass them in 'render_template()'.
         
         Returns:
-            dict: A dictionary of variables to inject.
+            MappingProxyType: A read-only mapping of variables to inject.
         """
-        return dict(
-            SITE_NAME = app.config.get("SITE_NAME"),
-            SITE_TAGLINE = app.config.get("SITE_TAGLINE"),
-            PASSWORD_MIN_LENGTH = app.config.get("PASSWORD_MIN_LENGTH"),
-            PASSWORD_MAX_LENGTH = app.config.get("PASSWORD_MAX_LENGTH")
-        )
+        return meta_data
+
+    # The base template reads the user's theme hues through this global,
+    # which serves them from Theme's shared TTL cache.
+    app.jinja_env.globals["theme_hues"] = app.db_manager.theme.get_hues
 
     # --- 6. Register all routes and blueprints ---
     # This uses your custom routing system
     from .routes import ROUTES
+    from .helper.classes.routes.RouteInitialiser import RouteInitialiser
+    from .helper.classes.routes.RouteValidator import RouteValidator
     route_reg = RouteInitialiser(app, RouteValidator())
     route_reg.register_routes(ROUTES)
 
-    # --- 7. Register custom CLI commands ---
-    # This makes 'flask seed-db' and 'flask reset-db' available
-    register_commands(app)
+    # --- 7. Register CLI-only extensions and commands ---
+    # Flask-Migrate ('flask db ...') and the seed commands are only used
+    # from the 'flask' command line, so app instances that only serve
+    # requests (e.g., Gunicorn workers) skip importing them entirely.
+    if _is_cli():
+        # Initialize Flask-Migrate for database migrations
+        from flask_migrate import Migrate
+        migrate = Migrate(app, db)
+
+        # This makes 'flask seed-db' and 'flask reset-db' available
+        from .seed.commands import register_commands
+        register_commands(app)
 
     # --- 8. Register custom Jinja filters ---
     # Adds the built-in 'zip' function as a filter in Jinja
     app.jinja_env.filters["zip"] = zip
 
+    # --- 9. Configure Jinja bytecode caching ---
+    # Enabled in production only (see 'ProductionConfig')
+    if app.config.get("JINJA_BYTECODE_CACHE"):
+        from jinja2 import FileSystemBytecodeCache
+
+        cache_dir = os.path.join(app.instance_path, "jinja_cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
     return app
\ No newline at end of file
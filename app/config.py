@@ -9,43 +9,93 @@ app/__init__.py uses this file to load the correct settings.
 
 import os
 from dotenv import load_dotenv
-from datetime import timedelta
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from pathlib import Path
 
-# Load environment variables from a .env file (e.g., SECRET_KEY)
-# This makes them available in os.environ
-load_dotenv()
+# The .env file lives in the project root (one level above 'app/').
+# Passing the path directly skips python-dotenv's directory search.
+__ENV_PATH__ = Path(__file__).resolve().parent.parent / ".env"
 
+@lru_cache(maxsize=1)
+def load_env() -> bool:
+    """
+    Loads environment variables from the .env file (e.g., SECRET_KEY).
+
+    '@lru_cache(maxsize=1)' ensures the file is read and parsed only
+    once per process. In production the environment is provided by the
+    host (e.g., Render), so the .env file is not read at all.
+
+    Returns:
+        bool: True if any variables were loaded, False otherwise.
+    """
+    if os.environ.get("FLASK_CONFIG") == "production":
+        return False
+
+    return load_dotenv(__ENV_PATH__)
+
+# This must run before the config classes below read from os.environ.
+# This module is only imported by 'create_app' (or run.py), so the .env
+# file is no longer read just by importing the 'app' package.
+load_env()
+
+@dataclass(frozen=True, slots=True)
 class DefaultConfig():
     """
     Base configuration class.
 
     Contains default settings that are shared across all environments
     or provide a fallback if an environment variable is not set.
+
+    The config classes are frozen, slotted dataclasses: settings are
+    read from an instance via 'to_dict()', which walks the declared
+    fields instead of sweeping 'dir()' over the class hierarchy.
     """
     # 1. Security
     # SECRET_KEY is used by Flask for session signing and CSRF protection.
     # It's loaded from the .env file or defaults to an insecure key for development.
-    SECRET_KEY = os.environ.get("SECRET_KEY") or "unsecure_dev_key"
+    SECRET_KEY: str = os.environ.get("SECRET_KEY") or "unsecure_dev_key"
 
     # 2. SQLAlchemy
     # Disables a Flask-SQLAlchemy feature that tracks object modifications
     # and emits signals, which adds unnecessary overhead.
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
+
+    # Options passed to 'create_engine()'. 'query_cache_size' sizes
+    # SQLAlchemy's compiled-statement cache (default 500 entries), so the
+    # managers' statements stay compiled instead of being evicted and
+    # re-compiled. Every query binds its values as parameters, so each
+    # statement shape needs only one cache entry.
+    SQLALCHEMY_ENGINE_OPTIONS: dict = field(default_factory=lambda: {
+        "query_cache_size": 2000
+    })
 
     # 3. Custom Application Metadata
     # These are custom settings used by the app's templates and managers.
-    SITE_NAME = "Projectify"
-    SITE_TAGLINE = "Organise Thoughts into Actions"
+    SITE_NAME: str = "Projectify"
+    SITE_TAGLINE: str = "Organise Thoughts into Actions"
     
     # Password complexity rules (used by PasswordManager and forms)
-    PASSWORD_MIN_LENGTH = 8
-    PASSWORD_MAX_LENGTH = 128
-    PASSWORD_CONTAINS_SYMBOL = True
-    PASSWORD_CONTAINS_CAP = True
+    PASSWORD_MIN_LENGTH: int = 8
+    PASSWORD_MAX_LENGTH: int = 128
+    PASSWORD_CONTAINS_SYMBOL: bool = True
+    PASSWORD_CONTAINS_CAP: bool = True
     
-    # Flask-Login "Remember Me" cookie duration
-    REMEMBER_COOKIE_DURATION = timedelta(days=30)
+    # Flask-Login "Remember Me" cookie duration, in seconds (30 days).
+    # Flask-Login accepts an int here, so no timedelta is needed at import.
+    REMEMBER_COOKIE_DURATION: int = 30 * 24 * 60 * 60
 
+    def to_dict(self) -> dict:
+        """
+        Collects the settings of this config into a plain dict.
+
+        Returns:
+            dict: A mapping of setting names to their values, ready
+                  for 'app.config.update()'.
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+@dataclass(frozen=True, slots=True)
 class ProductionConfig(DefaultConfig):
     """
     Configuration for the production (live) environment.
@@ -55,13 +105,34 @@ class ProductionConfig(DefaultConfig):
     """
     # 1. Database
     # Loads the production database URL from the 'DATABASE_URL_PROD' env var.
-    SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL_PROD")
+    SQLALCHEMY_DATABASE_URI: str | None = os.environ.get("DATABASE_URL_PROD")
+
+    # Adds connection pool settings to the engine options. Connections
+    # are kept open and reused across requests (no TCP/TLS handshake and
+    # auth per request). 'pool_recycle' replaces connections older than
+    # 30 minutes and 'pool_pre_ping' tests each one on checkout, so a
+    # database restart doesn't surface as errors on stale connections.
+    SQLALCHEMY_ENGINE_OPTIONS: dict = field(default_factory=lambda: {
+        "query_cache_size": 2000,
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True
+    })
 
     # 2. App State
     # Ensures Flask and extensions run in production-optimized mode
     # (e.g., debug=False).
-    TESTING = False
+    TESTING: bool = False
+
+    # 3. Templates
+    # Templates don't change between deploys, so skip the per-render
+    # modification check and cache compiled template bytecode on disk
+    # (in the instance folder) so workers don't re-compile them.
+    TEMPLATES_AUTO_RELOAD: bool = False
+    JINJA_BYTECODE_CACHE: bool = True
 
+@dataclass(frozen=True, slots=True)
 class TestingConfig(DefaultConfig):
     """
     Configuration for the local development and testing environment.
@@ -70,23 +141,23 @@ class TestingConfig(DefaultConfig):
     """
     # 1. Database
     # Loads the testing/development database URL from the 'DATABASE_URL_TEST' env var.
-    SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL_TEST")
+    SQLALCHEMY_DATABASE_URI: str | None = os.environ.get("DATABASE_URL_TEST")
 
     # 2. App State
     # Enables Flask's testing/debug mode.
-    TESTING = True
+    TESTING: bool = True
 
     # 3. Test User Data
     # Defines a test user dictionary used by the 'flask seed-db' command
     # *only* when TESTING=True.
-    TEST_USER = {
+    TEST_USER: dict = field(default_factory=lambda: {
         "first_name": "Alan",
         "surname": "O'Connor",
         "date_of_birth": "1995-11-07",
         "email": "testuser@projectify.com",
         "password": "Test!12345",
         "theme_name": "Default"
-    }
+    })
 
 # A dictionary mapping config keys to their respective classes.
 # This is used by the 'create_app' factory to select the environment
@@ -98,4 +169,22 @@ config = {
 }
 
 # A fallback alias for the DefaultConfig.
-DEFAULT = DefaultConfig
\ No newline at end of file
+DEFAULT = DefaultConfig
+
+@lru_cache(maxsize=None)
+def get_config(config_key: str) -> type:
+    """
+    Resolves a config key to its config class, falling back to DEFAULT.
+
+    The result is cached per key, so apps built repeatedly from the same
+    key (e.g., in test fixtures) reuse the same class. Combined with the
+    cached settings dict in app/__init__.py, each environment's settings
+    are only collected once per process.
+
+    Args:
+        config_key (str): The environment key (e.g., "production", "testing").
+
+    Returns:
+        type: The matching config class.
+    """
+    return config.get(config_key, DEFAULT)
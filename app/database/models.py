@@ -9,18 +9,21 @@ properties for accessing and manipulating data.
 
 import enum
 from app import db
-from sqlalchemy import Boolean, Enum, String, Integer, Date, ForeignKey, Text, desc
+from sqlalchemy import Boolean, Enum, String, Integer, Date, ForeignKey, Index, Text
 from typing import List
-from sqlalchemy import cast
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from sqlalchemy import func
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+from datetime import datetime, date
+from flask import g, has_app_context
 from flask_login import UserMixin
-from datetime import date
 
 # --- Enums ---
 # These enums are used to define strict, allowed values for certain columns.
-# Using 'native_enum=True' in the models makes PostgreSQL store these as
-# native ENUM types, which is very efficient.
+# 'Project.status' and 'Task.difficulty' are stored as VARCHAR with a CHECK
+# constraint ('native_enum=False') rather than as native PostgreSQL ENUM
+# types, so adding a value is a constraint swap instead of an
+# 'ALTER TYPE ... ADD VALUE' (which can't run inside a transaction).
 
 class ThemeMode(enum.Enum):
     """Defines the allowed display modes for the theme system."""
@@ -40,7 +43,59 @@ class Difficulty(enum.Enum):
     MEDIUM = "medium"
     HARD ="hard"
 
+# --- Helpers ---
+
+def _today() -> date:
+    """
+    Returns today's date, computed once per request.
+
+    The date-based properties below are read many times while a page
+    renders (once per project card and task row). Storing the date on 'g'
+    avoids repeated 'date.today()' calls and keeps every card in one
+    request consistent, even if it renders across midnight. Outside an app
+    context (e.g., scripts), it falls back to 'date.today()'.
+
+    Returns:
+        date: The current date.
+    """
+    if not has_app_context():
+        return date.today()
+
+    today = g.get("_today")
+    if today is None:
+        today = g._today = date.today()
+    return today
+
+@dataclass(frozen=True, slots=True)
+class ProjectStats:
+    """Task counts for one Project, as aggregated by the database."""
+    total: int = 0
+    done: int = 0
+
+def _project_stats(project_id: int) -> ProjectStats | None:
+    """
+    Returns the request's 'ProjectStats' for a project, if loaded.
+
+    'ProjectManager.load_project_stats()' fills 'g.project_stats' with a
+    single GROUP BY over the tasks of every listed project, so the task
+    counters on 'Project' don't load each project's Task rows.
+
+    Args:
+        project_id (int): The primary key of the project.
+
+    Returns:
+        ProjectStats | None: The counts, or None if they weren't loaded
+            (or there is no app context).
+    """
+    if not has_app_context():
+        return None
+
+    return g.get("project_stats", {}).get(project_id)
+
 # --- Models ---
+# Creation timestamps use 'server_default=func.now()' so the database
+# stamps each row at insert time. (A Python-side 'datetime.now()' default
+# would be evaluated once at import and shared by every row.)
 
 class Profile(db.Model, UserMixin):
     """
@@ -76,34 +131,41 @@ class Profile(db.Model, UserMixin):
     # 'cascade="all, delete-orphan"' means that when a Profile is deleted,
     # all of its related 'ProfileIdentity', 'Project', and 'Thought'
     # objects will be automatically deleted from the database.
+    # 'passive_deletes=True' leaves that to the foreign keys'
+    # 'ON DELETE CASCADE', so SQLAlchemy doesn't SELECT every child
+    # (and grandchild) row just to delete it one by one.
     
-    # 'lazy="selectin"' is a performance optimization. When a Profile is
-    # loaded, it will load its 'identities' in a single, separate query
-    # (using a 'SELECT ... WHERE profile_id IN (...)'), which avoids
-    # the "N+1 problem" of lazy="select".
+    # 'lazy="select"' so loading a Profile (on login, and in the
+    # user_loader on every request) doesn't also SELECT its identities.
+    # Only one Profile is loaded per request, so there is no N+1 to
+    # avoid: pages that show identities load them (with their templates,
+    # see 'ProfileIdentity.template') on first access, and the login and
+    # API paths that never read them skip the query.
     identities: Mapped[List["ProfileIdentity"]] = relationship(
-        back_populates="profile", cascade="all, delete-orphan", lazy="selectin"
+        back_populates="profile", cascade="all, delete-orphan", lazy="select", passive_deletes=True
     )
     projects: Mapped[List["Project"]] = relationship(
-        back_populates="profile", cascade="all, delete-orphan", lazy="select"
+        back_populates="profile", cascade="all, delete-orphan", lazy="select", passive_deletes=True
     )
     thoughts: Mapped[List["Thought"]] = relationship(
-        back_populates="profile", cascade="all, delete-orphan", lazy="select"
+        back_populates="profile", cascade="all, delete-orphan", lazy="select", passive_deletes=True
     )
     
-    # 'lazy="joined"' means that when a Profile is loaded, SQLAlchemy
-    # will perform a SQL JOIN to fetch the 'Theme' object in the *same*
-    # query. This is efficient because a Profile only has one Theme.
-    theme: Mapped["Theme"] = relationship(lazy="joined")
+    # 'lazy="select"' so Profile lookups (e.g., on login, or in the
+    # user_loader) don't JOIN the themes table when the theme isn't read.
+    # Page renders get the hues from 'ThemeManager.get_hues()', which
+    # reads them through Theme's shared TTL cache, so the relationship is
+    # only loaded where the Theme object itself is needed.
+    theme: Mapped["Theme"] = relationship(lazy="select")
     
     created_at: Mapped[datetime] = mapped_column(
-        db.DateTime, 
-        default=datetime.now(timezone.utc), 
+        db.DateTime(timezone=True), 
+        server_default=func.now(), 
         nullable=False
     )
 
     def __repr__(self) -> str:
-        return f"<Profile {self.email}>"
+        return "<Profile %s>" % self.email
     
 class ProfileIdentity(db.Model):
     """
@@ -116,7 +178,7 @@ class ProfileIdentity(db.Model):
     """
     __tablename__ = "profile_identities"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    profile_id: Mapped[int] = mapped_column(ForeignKey('profiles.id'))
+    profile_id: Mapped[int] = mapped_column(ForeignKey('profiles.id', ondelete="CASCADE"), index=True)
     template_id: Mapped[int] = mapped_column(ForeignKey('identity_templates.id'))
     is_active: Mapped[Boolean] = mapped_column(Boolean, default=False)
     custom_name: Mapped[str] = mapped_column(String(30), nullable=True)
@@ -129,7 +191,7 @@ class ProfileIdentity(db.Model):
     # When a ProfileIdentity is deleted, all its associated Projects
     # and Thoughts are also deleted.
     projects: Mapped[List["Project"]] = relationship(
-        back_populates='profile_identity', cascade="all, delete-orphan", lazy="select"
+        back_populates='profile_identity', cascade="all, delete-orphan", lazy="select", passive_deletes=True
     )
     
     # The 'template' is lazy="joined" because an Identity always
@@ -142,17 +204,18 @@ class ProfileIdentity(db.Model):
         back_populates="profile_identity", 
         cascade="all, delete-orphan", 
         lazy="select",
-        order_by="desc(Thought.created_at)" # Thoughts page shows newest first
+        passive_deletes=True,
+        order_by=lambda: Thought.created_at.desc() # Thoughts page shows newest first
     )
     
     identity_created_at: Mapped[datetime] = mapped_column(
-        db.DateTime, 
-        default=datetime.now(timezone.utc), 
+        db.DateTime(timezone=True), 
+        server_default=func.now(), 
         nullable=False
     )
 
     def __repr__(self) -> str:
-        return f'<Profile Identity {self.id}>'
+        return "<Profile Identity %s>" % self.id
 
 
 class IdentityTemplate(db.Model):
@@ -166,7 +229,7 @@ class IdentityTemplate(db.Model):
     __tablename__ = "identity_templates"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(80), unique=True, nullable=False)
-    description: Mapped[str] = mapped_column(String(255))
+    description: Mapped[str] = mapped_column(Text)
     image: Mapped[str] = mapped_column(String(120), nullable=False)
     
     profile_identities: Mapped[List["ProfileIdentity"]] = relationship(
@@ -174,13 +237,13 @@ class IdentityTemplate(db.Model):
         lazy="select"
     )
     created_at: Mapped[datetime] = mapped_column(
-        db.DateTime, 
-        default=datetime.now(timezone.utc), 
+        db.DateTime(timezone=True), 
+        server_default=func.now(), 
         nullable=False
     )
 
     def __repr__(self) -> str:
-        return f'<Identity {self.name}>'
+        return "<Identity %s>" % self.name
 
 
 class Project(db.Model):
@@ -191,10 +254,19 @@ class Project(db.Model):
     'ProfileIdentity' (the workspace). It contains a list of tasks.
     """
     __tablename__ = "projects"
+
+    # Projects are listed per identity and the active one is looked up
+    # among them, so one index serves both (and any 'identity_id' lookup).
+    # The status filter on the projects page gets its own index.
+    __table_args__ = (
+        Index("ix_projects_identity_active", "identity_id", "is_active"),
+        Index("ix_projects_status", "status"),
+    )
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    owner_id: Mapped[int] = mapped_column(ForeignKey("profiles.id"))
+    owner_id: Mapped[int] = mapped_column(ForeignKey("profiles.id", ondelete="CASCADE"), index=True)
     identity_id: Mapped[int] = mapped_column(
-        db.ForeignKey("profile_identities.id")
+        db.ForeignKey("profile_identities.id", ondelete="CASCADE")
     )
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     is_active: Mapped[Boolean] = mapped_column(Boolean, default=False)
@@ -208,14 +280,15 @@ class Project(db.Model):
         back_populates="projects"
     )
     
-    # 'lazy="selectin"' is a key performance optimization here.
-    # When a Project is loaded, all its Tasks are loaded in one
-    # go. This is crucial for the 'tasks_completed_percentage'
-    # property to work without N+1 queries.
+    # 'lazy="select"' so listing projects doesn't pull every Task row.
+    # The task counters below read from 'ProjectStats' (one GROUP BY per
+    # request, see 'ProjectManager.load_project_stats()'), and views that
+    # need the rows themselves ask for them with 'selectinload(Project.tasks)'.
     tasks: Mapped[List["Task"]] = relationship(
         back_populates="project", 
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="select",
+        passive_deletes=True
     )
 
     start_date: Mapped[date] = mapped_column(
@@ -227,32 +300,50 @@ class Project(db.Model):
         nullable=False,
     )
     
-    # Uses a native PostgreSQL ENUM for the 'status' column.
+    # Stored as VARCHAR + CHECK constraint (see the Enums note above).
     status: Mapped[Status] = mapped_column(
         Enum(
             Status, 
-            native_enum=True, # Use PG ENUM
+            native_enum=False,
+            create_constraint=True,
+            name="ck_projects_status",
+            length=16,
             values_callable=lambda obj: [e.value for e in obj]
         ),
         default=Status.NOT_STARTED,
         nullable=False,
     )
     created_at: Mapped[datetime] = mapped_column(
-        db.DateTime, 
-        default=datetime.now(timezone.utc), 
+        db.DateTime(timezone=True), 
+        server_default=func.now(), 
         nullable=False
     )
 
+    @validates("status")
+    def validate_status(self, key, value) -> Status:
+        """
+        Coerces a status value (e.g., 'completed') to its 'Status' member.
+
+        The managers assign raw strings, which the column would only turn
+        into 'Status' members after a reload. Coercing on assignment keeps
+        'status == Status.COMPLETED' correct for the rest of the request
+        and rejects unknown values before they reach the CHECK constraint.
+
+        Raises:
+            ValueError: If the value is not a valid 'Status'.
+        """
+        return value if isinstance(value, Status) else Status(value)
+
     @property
     def is_overdue(self) -> bool:
         """Checks if the project is past its end_date and not completed."""
         if not self.end_date:
             return False
         
-        return (self.status != Status.COMPLETED and self.end_date < date.today())
+        return (self.status != Status.COMPLETED and self.end_date < _today())
 
     def __repr__(self) -> str:
-        return f"<Project {self.name}>"
+        return "<Project %s>" % self.name
     
     @property
     def time_elapsed_percentage(self):
@@ -260,7 +351,7 @@ class Project(db.Model):
         Calculates what percentage of the project's *time* has passed.
         (e.g., 50% if 10 days have passed on a 20-day project).
         """
-        today = date.today()
+        today = _today()
         if self.status == Status.COMPLETED:
             return 100
         
@@ -274,15 +365,15 @@ class Project(db.Model):
             return 100
 
         elapsed_duration = (today - self.start_date).days
-        percentage = elapsed_duration / total_duration * 100
+        percentage = elapsed_duration * 100 // total_duration
 
         # Clamp value between 0 and 100
-        return int(min(max(percentage, 0), 100))
+        return 0 if percentage < 0 else 100 if percentage > 100 else percentage
     
     @property
     def time_left(self):
         """Calculates the number of days remaining until the end_date."""
-        today = date.today()
+        today = _today()
         if self.status == Status.COMPLETED:
             return 0
         
@@ -301,20 +392,25 @@ class Project(db.Model):
         """
         Calculates what percentage of the project's *tasks* are complete.
         
-        This relies on the 'tasks' relationship being loaded via 'lazy="selectin"'.
+        Reads the request's 'ProjectStats' when they have been loaded,
+        falling back to the 'tasks' collection.
         """
         if self.status == Status.COMPLETED:
             return 100
         
-        if not len(self.tasks):
+        stats = _project_stats(self.id)
+        if stats is not None:
+            total_tasks, tasks_completed = stats.total, stats.done
+        else:
+            total_tasks = len(self.tasks)
+            # Count tasks where task.is_complete is True, without building a list
+            tasks_completed = sum(1 for task in self.tasks if task.is_complete)
+
+        if not total_tasks:
             return 0
-        
-        # Count tasks where task.is_complete is True
-        tasks_completed = [task for task in self.tasks if task.is_complete]
 
-        percentage = float((len(tasks_completed) / len(self.tasks)) * 100)
-
-        return float(min(max(percentage, 0), 100))
+        # Whole-number percentage; 'tasks_completed' can't exceed 'total_tasks'
+        return tasks_completed * 100 // total_tasks
 
     @property
     def tasks_incomplete(self):
@@ -322,17 +418,27 @@ class Project(db.Model):
         if self.status == Status.COMPLETED:
             return 0 # Changed this from len(self.tasks) to be more intuitive
 
-        if not len(self.tasks):
-            return 0
-
-        total_tasks = len(self.tasks)
-        tasks_incompleted = len([task for task in self.tasks if not task.is_complete])
+        stats = _project_stats(self.id)
+        if stats is not None:
+            return stats.total - stats.done
 
-        return int(min(max(tasks_incompleted, 0), total_tasks))
+        # Count tasks where task.is_complete is False in a single pass. The
+        # count can't leave [0, total], so no clamping is needed.
+        return sum(1 for task in self.tasks if not task.is_complete)
 
     @property
     def total_tasks(self):
-        """Returns the total number of tasks for this project."""
+        """
+        Returns the total number of tasks for this project.
+
+        Like the other task counters, this reads the request's
+        'ProjectStats' when they have been loaded, falling back to the
+        'tasks' collection.
+        """
+        stats = _project_stats(self.id)
+        if stats is not None:
+            return stats.total
+
         return len(self.tasks)
 
 
@@ -341,19 +447,21 @@ class Task(db.Model):
     Represents a single Task.
     
     A task belongs to one Project. Its 'difficulty' is stored as a
-    native PostgreSQL ENUM.
+    VARCHAR limited to the 'Difficulty' values by a CHECK constraint.
     """
     __tablename__ = "tasks"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
-    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"))
+    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id", ondelete="CASCADE"), index=True)
     due_date: Mapped[date] = mapped_column(Date, nullable=False)
     
     difficulty: Mapped[Difficulty] = mapped_column(
         Enum(
             Difficulty, 
-            native_enum=True,
-            name="difficulty",
+            native_enum=False,
+            create_constraint=True,
+            name="ck_tasks_difficulty",
+            length=16,
             values_callable=lambda obj: [e.value for e in obj]
         ),
         default=Difficulty.MEDIUM.value,
@@ -362,26 +470,40 @@ class Task(db.Model):
     
     is_complete: Mapped[bool] = mapped_column(Boolean, default=False)
     
-    # 'lazy="joined"' is a good choice here, as a Task almost
-    # always needs to know its parent Project's info.
+    # 'lazy="select"' so loading tasks doesn't JOIN the parent Project
+    # onto every row. Tasks are listed per project, and the views only
+    # need 'project_id'. Queries that need the Project can add
+    # '.options(selectinload(Task.project))'.
     project: Mapped["Project"] = relationship(
         back_populates="tasks",
-        lazy="joined"
+        lazy="select"
     )
     
     created_at: Mapped[datetime] = mapped_column(
-        db.DateTime, 
-        default=datetime.now(timezone.utc), 
+        db.DateTime(timezone=True), 
+        server_default=func.now(), 
         nullable=False
     )
 
+    @validates("difficulty")
+    def validate_difficulty(self, key, value) -> Difficulty:
+        """
+        Coerces a difficulty value (e.g., 'easy') to its 'Difficulty' member.
+
+        See 'Project.validate_status()'.
+
+        Raises:
+            ValueError: If the value is not a valid 'Difficulty'.
+        """
+        return value if isinstance(value, Difficulty) else Difficulty(value)
+
     @property
     def time_left(self):
         """Calculates the number of days remaining until the due_date."""
         if not self.due_date:
             return 0
         
-        today = date.today()
+        today = _today()
         days_remaining = (self.due_date - today).days
 
         # A task can have negative days (overdue), but we'll show 0
@@ -393,7 +515,7 @@ class Task(db.Model):
         Calculates what percentage of the task's *time* has passed
         (from creation to due date).
         """
-        today = date.today()
+        today = _today()
         start = self.created_at.date() # Get the date part of the creation timestamp
 
         if self.is_complete:
@@ -415,12 +537,12 @@ class Task(db.Model):
         if total == 0:
             return 100
 
-        percentage = (elapsed / total) * 100
+        percentage = elapsed * 100 // total
 
-        return int(min(max(percentage, 0), 100))
+        return 0 if percentage < 0 else 100 if percentage > 100 else percentage
 
     def __repr__(self) -> str:
-        return f"<Task {self.name}>"
+        return "<Task %s>" % self.name
 
 class Thought(db.Model):
     """
@@ -429,32 +551,41 @@ class Thought(db.Model):
     A thought is owned by both a 'Profile' and a 'ProfileIdentity'.
     """
     __tablename__ = "thoughts"
+
+    # Thoughts are fetched per identity and ordered by creation time, so
+    # one index serves the filter and the ORDER BY.
+    __table_args__ = (
+        Index("ix_thoughts_pi_created", "profile_identity_id", "created_at"),
+    )
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    profile_id: Mapped[int] = mapped_column(ForeignKey("profiles.id"))
-    profile_identity_id: Mapped[int] = mapped_column(ForeignKey("profile_identities.id"))
+    profile_id: Mapped[int] = mapped_column(ForeignKey("profiles.id", ondelete="CASCADE"), index=True)
+    profile_identity_id: Mapped[int] = mapped_column(ForeignKey("profile_identities.id", ondelete="CASCADE"))
 
     content: Mapped[str] = mapped_column(Text, nullable=False)
     
-    # 'lazy="joined"' is efficient as a thought's content is
-    # almost always displayed with its profile/identity.
+    # 'lazy="select"' so listing thoughts doesn't JOIN a full Profile and
+    # ProfileIdentity (and its template) onto every row. Thoughts are
+    # always fetched for the current profile and identity, which are
+    # already loaded. Queries that need them can add
+    # '.options(selectinload(Thought.profile), selectinload(Thought.profile_identity))'.
     profile: Mapped["Profile"] = relationship(
         back_populates="thoughts",
-        lazy="joined"
+        lazy="select"
     )
     profile_identity: Mapped["ProfileIdentity"] = relationship(
         back_populates="thoughts",
-        lazy="joined",
-        order_by="desc(Thought.created_at)"
+        lazy="select"
     )
     
     created_at: Mapped[datetime] = mapped_column(
-        db.DateTime, 
-        default=datetime.now(timezone.utc), 
+        db.DateTime(timezone=True), 
+        server_default=func.now(), 
         nullable=False
     )
 
     def __repr__(self) -> str:
-        return f"<Thought {self.id}>"
+        return "<Thought %s>" % self.id
 
 class Theme(db.Model):
     """
@@ -475,4 +606,11 @@ class Theme(db.Model):
     text_hue: Mapped[int] = mapped_column(Integer)
 
     def __repr__(self) -> str:
-        return f"<Theme {self.name}>"
+        return "<Theme %s>" % self.name
+
+# --- Shared Read Cache ---
+# Themes and identity templates are only written by seeding, so
+# 'BaseManager.read_item()'/'read_items()' also cache them across requests
+# for this many seconds (and drop them on any write through a manager).
+Theme.shared_cache_ttl = 60.0
+IdentityTemplate.shared_cache_ttl = 60.0
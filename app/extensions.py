@@ -10,6 +10,9 @@ This prevents circular import issues, as the app-bound extensions
 are not imported directly by other modules.
 """
 
+from sqlite3 import Connection as SQLiteConnection
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from flask_sqlalchemy import SQLAlchemy
 from flask_wtf.csrf import CSRFProtect
 from flask_login import LoginManager
@@ -19,6 +22,16 @@ from flask_login import LoginManager
 # that connects Flask to the PostgreSQL database.
 db = SQLAlchemy()
 
+# SQLite doesn't enforce foreign keys unless each connection turns them on.
+# The models' 'passive_deletes=True' relies on 'ON DELETE CASCADE', so
+# without this a delete against a SQLite database would orphan child rows.
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    if isinstance(dbapi_connection, SQLiteConnection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 # --- 2. Security ---
 # The CSRFProtect object from Flask-WTF. This provides
 # Cross-Site Request Forgery (CSRF) protection for all POST forms.
@@ -11,6 +11,11 @@ from app.helper.classes.database.ProfileManager import ProfileManager, PasswordM
 from app.database.models import Profile
 from flask_login import login_user, logout_user
 from app.helper.functions.response_schemas import success_res, error_res
+from types import MappingProxyType
+
+# The one response for any failed login (unknown email or wrong password).
+# Built once and shared read-only, since it never varies between calls.
+_INVALID_CREDS = MappingProxyType(error_res("Invalid Email or Password..."))
 
 class AuthManager:
     """
@@ -21,6 +26,10 @@ class AuthManager:
     Flask-Login's `login_user` and `logout_user` functions to
     manage the actual session.
     """
+    # A bcrypt hash to check the password against when the email is unknown,
+    # so a miss costs the same as a wrong password. Built on first use.
+    _DUMMY_HASH: str = ""
+
     def __init__(self, profile_manager: ProfileManager, password_manager: PasswordManager) -> None:
         """
         Initializes the AuthManager.
@@ -33,6 +42,18 @@ class AuthManager:
         """
         self.profile_manager: ProfileManager = profile_manager
         self.password_manager: PasswordManager = password_manager
+
+    def _dummy_hash(self) -> str:
+        """
+        Returns the process-wide dummy hash, hashing it on the first call.
+
+        Returns:
+            str: A bcrypt hash (at the app's usual cost) of a throwaway value.
+        """
+        if not AuthManager._DUMMY_HASH:
+            AuthManager._DUMMY_HASH = self.password_manager.hashpw("dummy-password").decode("utf-8")
+
+        return AuthManager._DUMMY_HASH
     
     def login(self, email: str, password: str, remember=False):
         """
@@ -53,9 +74,12 @@ class AuthManager:
         is_success: bool = profile_res.get("success", False)
 
         # If the email was not found, return a generic error.
-        # This prevents "email enumeration" attacks.
+        # This prevents "email enumeration" attacks. A bcrypt check is still
+        # run (and discarded) so the response takes as long as a wrong
+        # password would, rather than leaking which emails exist by timing.
         if not is_success:
-            return error_res(f"Invalid Email or Password...")
+            self.password_manager.verify(self._dummy_hash(), password)
+            return _INVALID_CREDS
 
         # --- 2. Verify the password ---
         payload = profile_res.get("payload", {})
@@ -66,7 +90,7 @@ class AuthManager:
 
         # If the password is not correct, return the same generic error.
         if not is_correct:
-            return error_res("Invalid Email or Password...")
+            return _INVALID_CREDS
         
         # --- 3. Log the user in ---
         # Both email and password are correct.
@@ -7,11 +7,123 @@ Update, Delete) methods that are inherited by specific managers
 (e.g., ProfileManager, ProjectManager).
 """
 
-from flask import Flask, g
+from __future__ import annotations
+
+from flask import g, current_app
 from app import get_db
-from sqlalchemy import select, insert, update, delete
+from sqlalchemy import select, insert, update, delete, bindparam, exists, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import raiseload, selectinload, make_transient_to_detached
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
+from threading import RLock
+from time import monotonic
+from types import MappingProxyType
 from app.helper.functions.response_schemas import success_res, error_res
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.helper.classes.database.DatabaseManager import DatabaseManager
+
+# Dialect 'insert()' constructs that support 'ON CONFLICT DO NOTHING'
+_CONFLICT_INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+@lru_cache(maxsize=256)
+def _compiled_select(model, keys: frozenset, eager: tuple = (), single: bool = False, nulls: frozenset = frozenset()):
+    """
+    Builds (once) the 'SELECT ... WHERE' statement for a model and filter keys.
+
+    Each filter is compared to a 'bindparam' named after its key, so the
+    statement doesn't depend on the values. It is built once per
+    (model, keys, eager, nulls) combination and reused, with the values
+    passed at execution time, which also keeps SQLAlchemy's compiled-SQL
+    cache hit every call.
+
+    A key filtered on None is compiled to 'IS NULL' instead (as 'filter_by'
+    does), since 'col = NULL' matches no rows. Which keys are None is part
+    of the cache key, so the same keys with and without a None value get
+    separate statements.
+
+    Args:
+        model (db.Model): The SQLAlchemy model class to query.
+        keys (frozenset): The names of the columns being filtered on.
+        eager (tuple, optional): Relationship names to 'selectinload'.
+        single (bool, optional): Add 'LIMIT 1', for lookups that want one row.
+        nulls (frozenset, optional): The keys whose filter value is None.
+
+    Returns:
+        Select: The statement, to execute with the filter values as params.
+    """
+    stmt = select(model).where(*(
+        getattr(model, key).is_(None) if key in nulls else getattr(model, key) == bindparam(key)
+        for key in keys
+    ))
+
+    if single:
+        stmt = stmt.limit(1)
+
+    if eager:
+        stmt = stmt.options(*(selectinload(getattr(model, rel)) for rel in eager))
+
+    return stmt
+
+def _null_keys(filter_criteria: dict) -> frozenset:
+    """
+    Returns the filter keys whose value is None, for '_compiled_select()'.
+
+    Args:
+        filter_criteria (dict): The keyword arguments used to filter the query.
+
+    Returns:
+        frozenset: The keys to compile to 'IS NULL'.
+    """
+    return frozenset(key for key, value in filter_criteria.items() if value is None)
+
+@lru_cache(maxsize=None)
+def _pk_name(model) -> str | None:
+    """
+    Returns the name of a model's primary key column, if it has just one.
+
+    Args:
+        model (db.Model): The SQLAlchemy model class.
+
+    Returns:
+        str | None: The primary key name, or None for a composite key.
+    """
+    primary_key = model.__mapper__.primary_key
+    return primary_key[0].key if len(primary_key) == 1 else None
+
+@lru_cache(maxsize=None)
+def _mapped_attrs(model) -> frozenset:
+    """
+    Returns the names of a model's mapped attributes (columns and relationships).
+
+    Args:
+        model (db.Model): The SQLAlchemy model class.
+
+    Returns:
+        frozenset: The attribute names 'update_item()' may set.
+    """
+    return frozenset(model.__mapper__.attrs.keys())
+
+@lru_cache(maxsize=None)
+def _column_names(model) -> tuple:
+    """
+    Returns the names of a model's column attributes.
+
+    Args:
+        model (db.Model): The SQLAlchemy model class.
+
+    Returns:
+        tuple: The attribute names stored in a shared cache snapshot.
+    """
+    return tuple(attr.key for attr in model.__mapper__.column_attrs)
 
 class BaseManager():
     """
@@ -22,6 +134,29 @@ class BaseManager():
     It handles database session access, request-level caching,
     and standardized success/error response generation for database operations.
     """
+    # Max entries kept in a request's read cache. Oldest-used entries are
+    # dropped first, so a view that reads many rows can't grow it without bound.
+    _REQUEST_CACHE_SIZE: int = 512
+
+    # Lists longer than this aren't kept in the request cache, so one large
+    # listing can't pin thousands of ORM objects for the rest of the request.
+    _CACHE_MAX_ITEMS: int = 500
+
+    # Rows fetched per batch by 'read_items(stream=True)'.
+    _STREAM_BATCH_SIZE: int = 1000
+
+    # Process-level read cache for models that set 'shared_cache_ttl' (see
+    # the end of models.py). Entries are column snapshots, not ORM objects,
+    # keyed like the request cache and grouped by model name so a write
+    # can drop them all. Shared by every thread in the worker, hence the lock.
+    _SHARED_CACHE: dict = {}
+    _SHARED_KEYS: dict = {}
+    _SHARED_LOCK = RLock()
+
+    # Managers are built once per app and hold no other per-instance
+    # state, so they use slots instead of a per-instance '__dict__'
+    __slots__ = ("_db_manager",)
+
     def __init__(self, db_manager_instance) -> None:
         """
         Initializes the BaseManager.
@@ -31,7 +166,6 @@ class BaseManager():
                                                   DatabaseManager to allow
                                                   access to other managers.
         """
-        from app.helper.classes.database.DatabaseManager import DatabaseManager
         self._db_manager: DatabaseManager = db_manager_instance
     
     @property
@@ -42,15 +176,26 @@ class BaseManager():
         Uses the Flask 'g' object to store the session, ensuring it is created
         once per request and is available to all manager methods.
 
+        'db.session' is a 'scoped_session' registry that looks up the
+        context's Session on every attribute access. Calling it once here
+        pins the request's actual Session on 'g', so the many session calls
+        a request makes skip that lookup. Flask-SQLAlchemy still closes the
+        Session (releasing its connection) when the app context ends.
+
+        Requests have it set up front by 'init_request_state()', so the
+        usual path is a single attribute read. Contexts without a request
+        (e.g., the CLI seed commands) create it on first use instead.
+
         Returns:
             sqlalchemy.orm.Session: The database session for this request.
         """
-        if not "db_session" in g:
-            # Get the db object from the app and create a new session
+        try:
+            return g.db_session
+        except AttributeError:
+            # Get the db object from the app and resolve this context's session
             db_object = get_db()
-            g.db_session = db_object.session
-
-        return g.db_session
+            g.db_session = db_object.session()
+            return g.db_session
 
     @property
     def _cache(self):
@@ -64,12 +209,162 @@ class BaseManager():
         Returns:
             dict: A dictionary to be used for caching query results.
         """
-        if "request_cache" not in g:
+        try:
+            return g.request_cache
+        except AttributeError:
             # Initialize an empty cache if one doesn't exist for this request
             g.request_cache = {}
-        
-        return g.request_cache
+            return g.request_cache
+
+    @staticmethod
+    def init_request_state() -> None:
+        """
+        Sets up the request's session and read cache on 'g' in one go.
+
+        Registered as a 'before_request' hook in 'create_app', so the
+        '_session' and '_cache' properties find both already in place.
+        """
+        g.db_session = get_db().session()
+        g.request_cache = {}
     
+    def _cache_get(self, cache_key):
+        """
+        Returns a cached read result, marking it as the most recently used.
+
+        Args:
+            cache_key (tuple): A key from '_cache_key()'.
+
+        Returns:
+            dict | None: The cached response, or None on a miss.
+        """
+        cache = self._cache
+        res = cache.pop(cache_key, None)
+        if res is not None:
+            # Re-insert at the end; dicts keep insertion order, so the
+            # first key is always the least recently used
+            cache[cache_key] = res
+
+        return res
+
+    def _cache_put(self, cache_key, res) -> None:
+        """
+        Stores a read result, dropping the least recently used entry if full.
+
+        Args:
+            cache_key (tuple): A key from '_cache_key()'.
+            res (dict): The response to cache.
+        """
+        cache = self._cache
+        if len(cache) >= self._REQUEST_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+
+        cache[cache_key] = res
+
+    def _evict_model(self, model) -> None:
+        """
+        Drops every cached read for a model, after a write to its table.
+
+        Args:
+            model (db.Model): The SQLAlchemy model class that was changed.
+        """
+        cache = self._cache
+        for cache_key in [key for key in cache if key[0] == model.__name__]:
+            del cache[cache_key]
+
+        with self._SHARED_LOCK:
+            for cache_key in self._SHARED_KEYS.pop(model.__name__, ()):
+                self._SHARED_CACHE.pop(cache_key, None)
+
+    def _shared_get(self, model, cache_key):
+        """
+        Rebuilds a read result from the process-level cache, if fresh.
+
+        The cached column values are merged into this request's session
+        with 'load=False', which attaches the instance without a SELECT.
+
+        Args:
+            model (db.Model): The SQLAlchemy model class being queried.
+            cache_key (tuple): A key from '_cache_key()'.
+
+        Returns:
+            list | None: The session-bound items, or None on a miss.
+        """
+        with self._SHARED_LOCK:
+            entry = self._SHARED_CACHE.get(cache_key)
+
+        if entry is None or entry[0] < monotonic():
+            return None
+
+        items = []
+        for snapshot in entry[1]:
+            item = model(**snapshot)
+            make_transient_to_detached(item)
+            items.append(self._session.merge(item, load=False))
+
+        return items
+
+    def _shared_put(self, model, cache_key, items) -> None:
+        """
+        Stores column snapshots of a read result in the process-level cache.
+
+        Args:
+            model (db.Model): The SQLAlchemy model class that was queried.
+            cache_key (tuple): A key from '_cache_key()'.
+            items (list): The loaded instances.
+        """
+        columns = _column_names(model)
+        snapshots = tuple(
+            MappingProxyType({ column: getattr(item, column) for column in columns })
+            for item in items
+        )
+
+        with self._SHARED_LOCK:
+            self._SHARED_CACHE[cache_key] = (monotonic() + model.shared_cache_ttl, snapshots)
+            self._SHARED_KEYS.setdefault(model.__name__, set()).add(cache_key)
+
+    def _cache_key(self, model, **filter_criteria) -> tuple:
+        """
+        Builds the request cache key for a model and a set of filter criteria.
+
+        Args:
+            model (db.Model): The SQLAlchemy model class being queried.
+            **filter_criteria: The keyword arguments used to filter the query.
+
+        Returns:
+            tuple: A hashable key that is stable regardless of keyword order.
+        """
+        # A frozenset is order-independent and hashed in C, so no sort is needed
+        return (model.__name__, frozenset(filter_criteria.items()))
+
+    def _list_options(self) -> tuple:
+        """
+        Builds the loader options for a list query.
+
+        In debug and testing this is 'raiseload("*")', so a template that
+        walks an unloaded relationship raises straight away instead of
+        quietly issuing one query per row (N+1). Production leaves the
+        lazy loads in place, so an access that slipped through still
+        renders. The list views read the task counters from
+        'ProjectStats', so none of them need a relationship eager-loaded.
+
+        Returns:
+            tuple: The options to pass to '.options()'.
+        """
+        if current_app.debug or current_app.testing:
+            return (raiseload("*"),)
+
+        return ()
+
+    def evict(self, model, **filter_criteria) -> None:
+        """
+        Removes a cached read result so the next read goes to the database.
+
+        Args:
+            model (db.Model): The SQLAlchemy model class that was queried.
+            **filter_criteria: The same keyword arguments used for the read.
+        """
+        self._cache.pop(self._cache_key(model, **filter_criteria), None)
+
     def read_item(self, model, item_name, **filter_criteria):
         """
         Reads a single item from the database based on filter criteria.
@@ -86,40 +381,81 @@ class BaseManager():
             dict: A standardized success or error response dictionary.
         """
         # Create a unique cache key based on the model and filter criteria
-        cache_key_parts = [f"{k}-{v}" for k, v in sorted(filter_criteria.items())]
-        cache_key = f"{model.__name__}-{'&'.join(cache_key_parts)}"
+        # (inlined '_cache_key()', saving a call and a kwargs repack)
+        cache_key = (model.__name__, frozenset(filter_criteria.items()))
 
         # Check if the result is already in the request cache
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Semi-static models are also cached across requests
+        shared = getattr(model, "shared_cache_ttl", None) is not None
         
         try:
-            # Build the select statement
-            stmt = select(model)
-
-            # Dynamically add 'where' clauses for each filter criterion
-            for key, value in filter_criteria.items():
-                attribute = getattr(model, key)
-                stmt = stmt.where(attribute == value)
-
-            # Execute the query, ensuring uniqueness, and get one result or None
-            item = self._session.execute(stmt).unique().scalars().one_or_none()
+            items = self._shared_get(model, cache_key) if shared else None
+            if items:
+                res = success_res(payload={ item_name.lower(): items[0] }, msg=f"{item_name} found")
+                self._cache_put(cache_key, res)
+                return res
+
+            pk_name = _pk_name(model)
+
+            if pk_name is not None and filter_criteria.keys() == {pk_name}:
+                # A primary key lookup: 'session.get()' checks the identity
+                # map first and only emits SQL if the row isn't loaded yet
+                item = self._session.get(model, filter_criteria[pk_name])
+            else:
+                # Get the (cached) select statement for these filter keys
+                # 'LIMIT 1' lets the database stop at the first match
+                stmt = _compiled_select(model, frozenset(filter_criteria), single=True, nulls=_null_keys(filter_criteria))
+
+                # Execute the query and get one result or None
+                item = self._session.scalars(stmt, filter_criteria).first()
 
             # Format the response
             res = success_res(payload={ item_name.lower(): item }, msg=f"{item_name} found") if item else error_res(msg=f"{item_name} not found")
 
             # If the query was successful, store the result in the cache
             if res.get("success"):
-                self._cache[cache_key] = res
+                self._cache_put(cache_key, res)
+                if shared:
+                    self._shared_put(model, cache_key, (item,))
 
             return res
 
-        except Exception as e:
-            # Handle any unexpected database errors
-            print(f"Unknown error occured. {e}")
-            return error_res(msg=f"An unknown error occured {e}")
+        except SQLAlchemyError:
+            # Handle any unexpected database errors. The traceback goes to the
+            # log; the response stays generic (no SQL or parameters in it).
+            current_app.logger.exception("read_item failed for %s", model.__name__)
+            return error_res(msg="An unknown database error occured")
     
-    def read_items(self, model, item_name, **filter_criteria):
+    def read_by_pk(self, model, item_name, pk):
+        """
+        Reads a single item by its primary key.
+
+        A shortcut for 'read_item(model, item_name, id=pk)' that goes
+        straight to 'session.get()'. The session's identity map already
+        acts as the per-request cache here, so no cache key is built and
+        no SQL is emitted if the row is loaded.
+
+        Args:
+            model (db.Model): The SQLAlchemy model class to query (e.g., Theme).
+            item_name (str): A human-readable name for the item (e.g., "Theme").
+            pk: The primary key value.
+
+        Returns:
+            dict: A standardized success or error response dictionary.
+        """
+        try:
+            item = self._session.get(model, pk)
+            return success_res(payload={ item_name.lower(): item }, msg=f"{item_name} found") if item else error_res(msg=f"{item_name} not found")
+
+        except SQLAlchemyError:
+            current_app.logger.exception("read_by_pk failed for %s", model.__name__)
+            return error_res(msg="An unknown database error occured")
+
+    def read_items(self, model, item_name, unique=False, eager=(), stream=False, **filter_criteria):
         """
         Reads multiple items from the database based on filter criteria.
 
@@ -128,45 +464,152 @@ class BaseManager():
         Args:
             model (db.Model): The SQLAlchemy model class to query (e.g., Thought).
             item_name (str): A human-readable name for the items (e.g., "Thoughts").
+            unique (bool, optional): De-duplicate the rows. Only needed when a
+                                     collection is joined-eager-loaded, which
+                                     repeats the parent rows. Defaults to False.
+            eager (tuple[str], optional): Relationships the caller will read on
+                                          every item (e.g., ("tasks",)). Each is
+                                          loaded for all items in one extra
+                                          'SELECT ... IN' instead of one query
+                                          per item. Defaults to ().
+            stream (bool, optional): Return an iterator that fetches the rows
+                                     in batches ('yield_per') instead of a
+                                     list, for callers that only loop over
+                                     the items once. The result isn't cached
+                                     and can't be combined with 'unique'.
+                                     Defaults to False.
             **filter_criteria: Keyword arguments to filter by.
 
         Returns:
             dict: A standardized success or error response dictionary.
         """
+        if stream:
+            return self._stream_items(model, item_name, eager, **filter_criteria)
+
         # Create a unique cache key based on the model and filter criteria
-        cache_key_parts = [f"{k}-{v}" for k, v in sorted(filter_criteria.items())]
-        cache_key = f"{model.__name__}-{'&'.join(cache_key_parts)}"
+        # (inlined '_cache_key()', saving a call and a kwargs repack)
+        cache_key = (model.__name__, frozenset(filter_criteria.items()))
+        if eager or unique:
+            # A plain read of the same filters leaves these relationships
+            # unloaded, so it must not be served for an eager one
+            cache_key += (tuple(eager), unique)
 
         # Check if the result is already in the request cache
-        if cache_key in self._cache:
-            print("Cached")
-            return self._cache[cache_key]
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Semi-static models are also cached across requests (not with
+        # 'eager', as the snapshots hold no relationships)
+        shared = not eager and getattr(model, "shared_cache_ttl", None) is not None
         
         try:
-            # Build the select statement
-            stmt = select(model)
+            items = self._shared_get(model, cache_key) if shared else None
+            if items:
+                res = success_res(payload={ item_name.lower(): items }, msg=f"{item_name} found")
+                self._cache_put(cache_key, res)
+                return res
 
-            # Dynamically add 'where' clauses for each filter criterion
-            for key, value in filter_criteria.items():
-                attribute = getattr(model, key)
-                stmt = stmt.where(attribute == value)
+            # Get the (cached) select statement for these filter keys
+            stmt = _compiled_select(model, frozenset(filter_criteria), tuple(eager), nulls=_null_keys(filter_criteria))
 
             # Execute the query and get all results
-            items = self._session.execute(stmt).unique().scalars().all()
+            result = self._session.scalars(stmt, filter_criteria)
+            items = (result.unique() if unique else result).all()
 
             # Format the response
             res = success_res(payload={ item_name.lower(): items }, msg=f"{item_name} found") if items else error_res(msg=f"{item_name} not found")
 
             # If the query was successful, store the result in the cache
-            if res.get("success"):
-                self._cache[cache_key] = res
+            if res.get("success") and len(items) <= self._CACHE_MAX_ITEMS:
+                self._cache_put(cache_key, res)
+                if shared:
+                    self._shared_put(model, cache_key, items)
 
             return res
         
-        except Exception as e:
-            return error_res(msg=f"An unknown error occured {e}")
+        except SQLAlchemyError:
+            current_app.logger.exception("read_items failed for %s", model.__name__)
+            return error_res(msg="An unknown database error occured")
 
-    def create_item(self, item, success_msg, item_name):
+    def _stream_items(self, model, item_name, eager=(), **filter_criteria):
+        """
+        Reads multiple items as an iterator, fetched in batches.
+
+        See 'read_items(stream=True)'. Only the first row is fetched up
+        front, to tell an empty result apart; the rest are loaded batch by
+        batch as the caller iterates.
+
+        Args:
+            model (db.Model): The SQLAlchemy model class to query.
+            item_name (str): A human-readable name for the items.
+            eager (tuple[str], optional): Relationships to 'selectinload'.
+            **filter_criteria: Keyword arguments to filter by.
+
+        Returns:
+            dict: A standardized success or error response dictionary.
+        """
+        try:
+            stmt = _compiled_select(model, frozenset(filter_criteria), tuple(eager), nulls=_null_keys(filter_criteria))
+            result = self._session.scalars(
+                stmt.execution_options(yield_per=self._STREAM_BATCH_SIZE),
+                filter_criteria
+            )
+
+            first = next(result, None)
+            if first is None:
+                return error_res(msg=f"{item_name} not found")
+
+            return success_res(payload={ item_name.lower(): chain((first,), result) }, msg=f"{item_name} found")
+
+        except SQLAlchemyError:
+            current_app.logger.exception("read_items failed for %s", model.__name__)
+            return error_res(msg="An unknown database error occured")
+
+    def _finish(self, commit: bool) -> None:
+        """
+        Ends a write helper: commits, or only flushes inside a 'transaction()'.
+
+        With 'commit=False' the helpers also leave errors to the
+        surrounding 'transaction()' (they re-raise rather than roll back).
+
+        Args:
+            commit (bool): Whether to commit the session.
+        """
+        if commit:
+            self._session.commit()
+        else:
+            # Send the SQL (so errors and generated keys show up now) but
+            # leave the commit to the surrounding 'transaction()'
+            self._session.flush()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Groups several writes into one transaction with a single commit.
+
+        Call the write helpers with 'commit=False' inside the block. The
+        session is committed when the block exits and rolled back if it
+        raises. With 'commit=False' a failing helper re-raises instead of
+        rolling back and returning an error response, so a failure part
+        way through rolls back every write in the block, not just its own.
+
+        Blocks don't nest: an inner block would commit the outer one early.
+        Helpers that run inside a caller's block (e.g.,
+        'ProjectManager.update_project_status()') use 'commit=False'
+        without opening their own.
+
+        Yields:
+            sqlalchemy.orm.Session: The database session for this request.
+        """
+        try:
+            yield self._session
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+
+    def create_item(self, item, success_msg, item_name, commit=True):
         """
         Adds a single new item (model instance) to the database.
 
@@ -174,35 +617,75 @@ class BaseManager():
             item (db.Model): The instantiated SQLAlchemy model to add (e.g., Profile(...)).
             success_msg (str): The message to return on success.
             item_name (str): A human-readable name for error messages.
+            commit (bool, optional): Commit when done. Pass False inside
+                                     'transaction()' to only flush (errors are
+                                     then raised, not returned). Defaults to True.
 
         Returns:
             dict: A standardized success or error response dictionary.
         """
         try:
             self._session.add(item)
-            self._session.commit()
+            self._finish(commit)
+            self._evict_model(type(item))
             return success_res(payload={ item_name.lower(): item }, msg=success_msg)
         
         # Error handling
-        except IntegrityError as e:
+        except IntegrityError:
+            if not commit:
+                raise
             # Rollback the session to prevent partial/failed transactions
             self._session.rollback()
-            return error_res(f"Could not create {item_name} due to database integrity error {e}")
+            return error_res(f"Could not create {item_name} due to a database integrity error")
 
-        except Exception as e:
+        except SQLAlchemyError:
+            if not commit:
+                raise
             self._session.rollback()
-            return error_res(f"Failed to create {item_name} due to an unknown database error: {e}")
+            current_app.logger.exception("Failed to create %s", item_name)
+            return error_res(f"Failed to create {item_name} due to an unknown database error")
         
-    def create_items(self, model, items, success_msg, item_name):
+    def _insert_ignore(self, model, index_elements):
+        """
+        Builds an 'INSERT ... ON CONFLICT DO NOTHING' for the current dialect.
+
+        Args:
+            model (db.Model): The model class to insert into.
+            index_elements (tuple[str]): The unique columns a conflict is checked on.
+
+        Returns:
+            Insert | None: The statement, or None if the dialect has no
+                           'ON CONFLICT' support.
+        """
+        insert_fn = _CONFLICT_INSERTS.get(self._session.get_bind().dialect.name)
+        if insert_fn is None:
+            return None
+
+        return insert_fn(model).on_conflict_do_nothing(index_elements=list(index_elements))
+
+    def create_items(self, model, items, success_msg, item_name, stmt=None, commit=True):
         """
         Adds multiple new items to the database in a single transaction (bulk insert).
 
+        The INSERT is compiled once and sent as a batched executemany
+        ('insertmanyvalues' in SQLAlchemy 2.0). Rows are batched together
+        only when they set the same columns, so 'items' should share the
+        same keys. 'render_nulls=True' keeps a None value from splitting a
+        batch; it is sent as NULL instead of leaving the column out (so a
+        None does not fall back to the column's default).
+
         Args:
             model (db.Model): The model class for the items being inserted.
             items (list[dict]): A list of dictionaries, where each dict contains
-                                the data for a new item.
+                                the data for a new item (all with the same keys).
             success_msg (str): The message to return on success.
             item_name (str): A human-readable name for error messages.
+            stmt (Insert, optional): A dialect INSERT to use instead of
+                                     'insert(model)' (e.g., one with
+                                     'ON CONFLICT DO NOTHING'). Defaults to None.
+            commit (bool, optional): Commit when done. Pass False inside
+                                     'transaction()' to only flush (errors are
+                                     then raised, not returned). Defaults to True.
 
         Returns:
             dict: A standardized success or error response dictionary.
@@ -210,22 +693,82 @@ class BaseManager():
         try:
             # Use bulk insert for efficiency
             self._session.execute(
-                insert(model),
+                (insert(model) if stmt is None else stmt).execution_options(render_nulls=True),
                 items
             )
-            self._session.commit()
+            self._finish(commit)
+            self._evict_model(model)
             return success_res(payload={}, msg=success_msg)
 
         # Error handling
-        except IntegrityError as e:
+        except IntegrityError:
+            if not commit:
+                raise
             self._session.rollback()
-            return error_res(f"Could not create one or more {item_name}s due to database integrity error {e}")
+            return error_res(f"Could not create one or more {item_name}s due to a database integrity error")
 
-        except Exception as e:
+        except SQLAlchemyError:
+            if not commit:
+                raise
             self._session.rollback()
-            return error_res(f"Failed to create one or more {item_name}s due to an unknown database error: {e}")
+            current_app.logger.exception("Failed to create one or more %ss", item_name)
+            return error_res(f"Failed to create one or more {item_name}s due to an unknown database error")
         
-    def update_item(self, item, item_name, success_msg, **item_kwargs):
+    def create_if_not_exists(self, model, item_name, success_msg, duplicate_msg, unique_cols, **values):
+        """
+        Adds a new row unless one with the same unique column values exists.
+
+        The duplicate check and the insert are a single statement,
+        'INSERT ... SELECT ... WHERE NOT EXISTS (...)', so this is one round
+        trip instead of a read followed by 'create_item()'. The unique
+        constraint still backs it up if two requests race.
+
+        Args:
+            model (db.Model): The model class to insert into.
+            item_name (str): A human-readable name for the item.
+            success_msg (str): The message to return on success.
+            duplicate_msg (str): The message to return if the row exists.
+            unique_cols (tuple[str]): The columns that identify a duplicate.
+            **values: The column values for the new row.
+
+        Returns:
+            dict: A standardized success or error response dictionary. On
+                  databases that support RETURNING, the payload holds the
+                  new item.
+        """
+        columns = model.__table__.c
+        rows = select(*(literal(value, columns[key].type) for key, value in values.items())).where(
+            ~exists().where(*(getattr(model, col) == values[col] for col in unique_cols))
+        )
+        stmt = insert(model).from_select(list(values), rows)
+
+        try:
+            if self._session.get_bind().dialect.insert_returning:
+                item = self._session.scalars(stmt.returning(model)).one_or_none()
+                created = item is not None
+            else:
+                item = None
+                created = self._session.execute(stmt).rowcount == 1
+
+            self._session.commit()
+
+        except IntegrityError:
+            # Lost a race with another insert of the same row
+            self._session.rollback()
+            return error_res(duplicate_msg)
+
+        except SQLAlchemyError:
+            self._session.rollback()
+            current_app.logger.exception("Failed to create %s", item_name)
+            return error_res(f"Failed to create {item_name} due to an unknown database error")
+
+        if not created:
+            return error_res(duplicate_msg)
+
+        self._evict_model(model)
+        return success_res(payload={ item_name.lower(): item } if item is not None else {}, msg=success_msg)
+
+    def update_item(self, item, item_name, success_msg, commit=True, **item_kwargs):
         """
         Updates attributes on a single, existing SQLAlchemy model instance.
 
@@ -235,34 +778,46 @@ class BaseManager():
             item (db.Model): The SQLAlchemy model instance to update.
             item_name (str): A human-readable name for error messages.
             success_msg (str): The message to return on successful update.
+            commit (bool, optional): Commit when done. Pass False inside
+                                     'transaction()' to only flush (errors are
+                                     then raised, not returned). Defaults to True.
             **item_kwargs: Keyword arguments for the fields to update.
 
         Returns:
             dict: A standardized success or error response dictionary.
         """
         try:
+            # The model's mapped attribute names (built once per model)
+            mapped_attrs = _mapped_attrs(type(item))
+
             # Loop through the provided keyword arguments
             for key, value in item_kwargs.items():
-                # Check if the model instance actually has this attribute
-                if hasattr(item, key):
+                # Only set attributes the model actually maps
+                if key in mapped_attrs:
                     # Update the attribute on the model instance
                     setattr(item, key, value)
             
             # Commit the changes to the database
-            self._session.commit()
+            self._finish(commit)
+            self._evict_model(type(item))
             return success_res(payload={}, msg=success_msg)
 
         # Error handling
-        except IntegrityError as e:
+        except IntegrityError:
+            if not commit:
+                raise
             self._session.rollback()
-            return error_res(f"Could not update {item_name} due to database integrity error {e}")
+            return error_res(f"Could not update {item_name} due to a database integrity error")
 
-        except Exception as e:
+        except SQLAlchemyError:
+            if not commit:
+                raise
             self._session.rollback()
-            return error_res(f"Failed to update {item_name} due to an unknown database error: {e}")
+            current_app.logger.exception("Failed to update %s", item_name)
+            return error_res(f"Failed to update {item_name} due to an unknown database error")
         
 
-    def update_items(self, model, item_name, success_msg, filter_criteria, update_values):
+    def update_items(self, model, item_name, success_msg, filter_criteria, update_values, commit=True):
         """
         Updates multiple items in the database that match filter criteria.
 
@@ -274,6 +829,9 @@ class BaseManager():
             success_msg (str): The message to return on success.
             filter_criteria (dict): A dict of columns/values to filter by (the 'WHERE' clause).
             update_values (dict): A dict of columns/values to update.
+            commit (bool, optional): Commit when done. Pass False inside
+                                     'transaction()' to only flush (errors are
+                                     then raised, not returned). Defaults to True.
 
         Returns:
             dict: A standardized success or error response dictionary.
@@ -283,28 +841,35 @@ class BaseManager():
 
         # Build the 'UPDATE...WHERE...VALUES' statement
         stmt = (
-            update(
-                (model)
-                .where_by(**filter_criteria)  # e.g., .where_by(profile_id=1)
-                .values(**update_values)       # e.g., .values(is_active=False)
-            )
+            update(model)
+            .filter_by(**filter_criteria)  # e.g., .filter_by(profile_id=1)
+            .values(**update_values)       # e.g., .values(is_active=False)
         )
 
         try:
-            self._session.execute(stmt)
-            self._session.commit()
+            # A single UPDATE round-trip. 'synchronize_session=False' skips
+            # matching the rows against objects already in the session;
+            # the commit below expires them, so they reload fresh anyway.
+            self._session.execute(stmt, execution_options={ "synchronize_session": False })
+            self._finish(commit)
+            self._evict_model(model)
             return success_res(payload={}, msg=success_msg)
         
         # Error handling
-        except IntegrityError as e:
+        except IntegrityError:
+            if not commit:
+                raise
             self._session.rollback()
-            return error_res(f"Could not update one or more {item_name}s due to database integrity error {e}")
+            return error_res(f"Could not update one or more {item_name}s due to a database integrity error")
 
-        except Exception as e:
+        except SQLAlchemyError:
+            if not commit:
+                raise
             self._session.rollback()
-            return error_res(f"Failed to update one more {item_name}s due to an unknown database error: {e}")
+            current_app.logger.exception("Failed to update one more %ss", item_name)
+            return error_res(f"Failed to update one more {item_name}s due to an unknown database error")
 
-    def delete_item(self, item, item_name, success_msg):
+    def delete_item(self, item, item_name, success_msg, commit=True):
         """
         Deletes a single, existing SQLAlchemy model instance from the database.
 
@@ -312,25 +877,34 @@ class BaseManager():
             item (db.Model): The model instance to delete.
             item_name (str): A human-readable name for error messages.
             success_msg (str): The message to return on success.
+            commit (bool, optional): Commit when done. Pass False inside
+                                     'transaction()' to only flush (errors are
+                                     then raised, not returned). Defaults to True.
 
         Returns:
             dict: A standardized success or error response dictionary.
         """
         try:
             self._session.delete(item)
-            self._session.commit()
+            self._finish(commit)
+            self._evict_model(type(item))
             return success_res(payload={}, msg=success_msg)
 
         # Error handling
-        except IntegrityError as e:
+        except IntegrityError:
+            if not commit:
+                raise
             self._session.rollback()
-            return error_res(f"Could not delete {item_name} due to database integrity error {e}")
+            return error_res(f"Could not delete {item_name} due to a database integrity error")
 
-        except Exception as e:
+        except SQLAlchemyError:
+            if not commit:
+                raise
             self._session.rollback()
-            return error_res(f"Failed to delete {item_name} due to an unknown database error: {e}")
+            current_app.logger.exception("Failed to delete %s", item_name)
+            return error_res(f"Failed to delete {item_name} due to an unknown database error")
 
-    def delete_items(self, model, item_name, success_msg, **filter_criteria):
+    def delete_items(self, model, item_name, success_msg, commit=True, **filter_criteria):
         """
         Deletes multiple items from the database based on filter criteria.
 
@@ -340,6 +914,9 @@ class BaseManager():
             model (db.Model): The model class to delete from.
             item_name (str): A human-readable name for error messages.
             success_msg (str): The message to return on success.
+            commit (bool, optional): Commit when done. Pass False inside
+                                     'transaction()' to only flush (errors are
+                                     then raised, not returned). Defaults to True.
             **filter_criteria: Keyword arguments to filter by (the 'WHERE' clause).
 
         Returns:
@@ -349,18 +926,25 @@ class BaseManager():
             return error_res(f"Missing filter criteria")
 
         # Build the 'DELETE...WHERE...' statement
-        stmt = delete(model).where_by(**filter_criteria)
+        stmt = delete(model).filter_by(**filter_criteria)
 
         try:
-            self._session.execute(stmt)
-            self._session.commit()
+            # A single DELETE round-trip (see 'update_items()')
+            self._session.execute(stmt, execution_options={ "synchronize_session": False })
+            self._finish(commit)
+            self._evict_model(model)
             return success_res(payload={}, msg=success_msg)
             
         # Error handling
-        except IntegrityError as e:
+        except IntegrityError:
+            if not commit:
+                raise
             self._session.rollback()
-            return error_res(f"Could not delete one or more {item_name}s due to database integrity error {e}")
+            return error_res(f"Could not delete one or more {item_name}s due to a database integrity error")
 
-        except Exception as e:
+        except SQLAlchemyError:
+            if not commit:
+                raise
             self._session.rollback()
-            return error_res(f"Failed to delete one more {item_name}s due to an unknown database error: {e}")
\ No newline at end of file
+            current_app.logger.exception("Failed to delete one more %ss", item_name)
+            return error_res(f"Failed to delete one more {item_name}s due to an unknown database error")
\ No newline at end of file
@@ -8,7 +8,6 @@ to the rest of the application, often via the Flask 'app' context
 (e.g., 'current_app.db_manager.profile').
 """
 
-from flask import Flask
 from .BaseManager import BaseManager
 from .ProfileManager import ProfileManager, PasswordManager
 from .IdentityTemplateManager import IdentityTemplateManager
@@ -24,9 +23,23 @@ class DatabaseManager(BaseManager):
 
     This class inherits from BaseManager to get access to the session
     and cache. Its primary role is to initialize and hold instances of all
-    other managers, making them accessible via properties. This follows
-    the Facade design pattern, simplifying access to the data layer.
+    other managers, making them accessible as plain attributes (e.g.,
+    'db_manager.profile'). This follows the Facade design pattern,
+    simplifying access to the data layer.
     """
+    # The child managers, set once in '__init__'. They are plain instance
+    # attributes rather than properties, so each access is a direct
+    # '__dict__' lookup with no descriptor call.
+    profile: ProfileManager
+    identity_template: IdentityTemplateManager
+    profile_identity: ProfileIdentityManager
+    thought: ThoughtManager
+    theme: ThemeManager
+    project: ProjectManager
+    task: TaskManager
+
+    __slots__ = ("profile", "identity_template", "profile_identity", "thought", "theme", "project", "task")
+
     def __init__(self, config) -> None:
         """
         Initializes the DatabaseManager and all child manager instances.
@@ -40,80 +53,10 @@ class DatabaseManager(BaseManager):
         # Initialize all specific managers, passing 'self' (the DatabaseManager)
         # to them. This allows managers to access each other
         # (e.g., TaskManager can access ProjectManager via self._db_manager.project).
-        self._profile_manager = ProfileManager(self, PasswordManager(config))
-        self._identity_template_manager = IdentityTemplateManager(self)
-        self._profile_identity_manager = ProfileIdentityManager(self)
-        self._thought_manager = ThoughtManager(self)
-        self._theme_manager = ThemeManager(self)
-        self._project_manager = ProjectManager(self)
-        self._task_manager = TaskManager(self)
-
-    @property
-    def profile(self) -> ProfileManager:
-        """
-        Provides access to the ProfileManager instance.
-
-        Returns:
-            ProfileManager: The manager for Profile and Password operations.
-        """
-        return self._profile_manager
-    
-    @property
-    def identity_template(self) -> IdentityTemplateManager:
-        """
-        Provides access to the IdentityTemplateManager instance.
-
-        Returns:
-            IdentityTemplateManager: The manager for identity templates.
-        """
-        return self._identity_template_manager
-    
-    @property
-    def profile_identity(self) -> ProfileIdentityManager:
-        """
-        Provides access to the ProfileIdentityManager instance.
-
-        Returns:
-            ProfileIdentityManager: The manager for user-specific identities.
-        """
-        return self._profile_identity_manager
-    
-    @property
-    def thought(self) -> ThoughtManager:
-        """
-        Provides access to the ThoughtManager instance.
-
-        Returns:
-            ThoughtManager: The manager for Thought operations.
-        """
-        return self._thought_manager
-
-    @property
-    def theme(self) -> ThemeManager:
-        """
-        Provides access to the ThemeManager instance.
-
-        Returns:
-            ThemeManager: The manager for Theme operations.
-        """
-        return self._theme_manager
-    
-    @property
-    def project(self) -> ProjectManager:
-        """
-        Provides access to the ProjectManager instance.
-
-        Returns:
-            ProjectManager: The manager for Project operations.
-        """
-        return self._project_manager
-    
-    @property
-    def task(self) -> TaskManager:
-        """
-        Provides access to the TaskManager instance.
-
-        Returns:
-            TaskManager: The manager for Task operations.
-        """
-        return self._task_manager
\ No newline at end of file
+        self.profile = ProfileManager(self, PasswordManager(config))
+        self.identity_template = IdentityTemplateManager(self)
+        self.profile_identity = ProfileIdentityManager(self)
+        self.thought = ThoughtManager(self)
+        self.theme = ThemeManager(self)
+        self.project = ProjectManager(self)
+        self.task = TaskManager(self)
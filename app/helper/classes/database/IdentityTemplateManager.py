@@ -1,9 +1,13 @@
 from .BaseManager import BaseManager
 from app.database.models import IdentityTemplate
 from app.helper.functions.response_schemas import success_res, error_res
+from flask import current_app
+from sqlalchemy.exc import SQLAlchemyError
 
 class IdentityTemplateManager(BaseManager):
     """Database operations for those centered around the Core Identity Table (Templates, not constructed)"""
+    __slots__ = ()
+
     def get_by_name(self, identity_name) -> dict:
         """Get an identity template by name."""
         # Simple operation, use the built Base Manager Abstraction
@@ -23,37 +27,47 @@ class IdentityTemplateManager(BaseManager):
     def create(self, **identity_kwargs) -> dict:
         """Create a new identity"""
         identity_kwargs["name"] = identity_kwargs.get("name").strip()
-        
-        # Check for duplicates
-        is_duplicate = self.get_by_name(identity_kwargs["name"]).get("success")
 
-        if is_duplicate:
-            return error_res(f"Identity already created.")
+        stmt = self._insert_ignore(IdentityTemplate, ("name",))
+        if stmt is not None:
+            # Duplicate check and insert in one round trip: a name that
+            # already exists inserts nothing, so no row comes back
+            try:
+                identity = self._session.scalars(
+                    stmt.values(**identity_kwargs).returning(IdentityTemplate)
+                ).one_or_none()
+                self._session.commit()
+                self._evict_model(IdentityTemplate)
+
+            except SQLAlchemyError:
+                self._session.rollback()
+                current_app.logger.exception("Failed to create Identity_Template")
+                return error_res("Failed to create Identity_Template due to an unknown database error")
 
-        return self.create_item(
-            item=IdentityTemplate(**identity_kwargs), 
-            success_msg="Identity created", 
-            item_name="Identity_Template", 
+            if identity is None:
+                return error_res(f"Identity already created.")
+
+            return success_res(payload={ "identity_template": identity }, msg="Identity created")
+        
+        # Otherwise 'INSERT ... SELECT ... WHERE NOT EXISTS', also one round trip
+        return self.create_if_not_exists(
+            model=IdentityTemplate,
+            item_name="Identity_Template",
+            success_msg="Identity created",
+            duplicate_msg="Identity already created.",
+            unique_cols=("name",),
+            **identity_kwargs
         )
     
     def init(self, template_data) -> dict:
         """Initialises the identities to seed multiple identities with a single DB call"""
-        # Empty list to add Templates too
-        templates_to_add = []
-        try:
-            # Iterate over the templates
-            for template in template_data:
-                # Create and add a template
-                new_template = IdentityTemplate(**template)
-                templates_to_add.append(new_template)
-
-            # Try commit the Teamplates to the DB
-            self._session.add_all(templates_to_add)
-            self._session.commit()
-
-        # Handle errors, revert state
-        except Exception as e:
-            self._session.rollback()
-            return error_res(f"Failed to create template. Error raised: {e}")
-
-        return success_res(payload={ "templates": templates_to_add }, msg="Templates created...")
\ No newline at end of file
+        # One batched insert of the template dicts. Templates whose name is
+        # already taken are skipped, so re-running the seed only adds new ones.
+        stmt = self._insert_ignore(IdentityTemplate, ("name",))
+        return self.create_items(
+            model=IdentityTemplate,
+            items=template_data,
+            stmt=stmt,
+            success_msg="Templates created...",
+            item_name="Identity_Template",
+        )
\ No newline at end of file
@@ -9,9 +9,12 @@ This file defines the ProfileIdentityManager, which is the heart of the
 """
 
 from .BaseManager import BaseManager
-from app.database.models import Profile, ProfileIdentity
+from app.database.models import ProfileIdentity, Project
 from app.helper.functions.response_schemas import success_res, error_res
-from sqlalchemy import select
+from sqlalchemy import select, update, case
+from sqlalchemy.orm import selectinload
+from sqlalchemy.exc import SQLAlchemyError
+from flask import current_app
 
 class ProfileIdentityManager(BaseManager):
     """
@@ -22,6 +25,8 @@ class ProfileIdentityManager(BaseManager):
     updates custom names, and initializes the default set of identities 
     for new users.
     """
+    __slots__ = ()
+
     
     def get_by_profile_id(self, profile_id) -> dict:
         """
@@ -179,6 +184,37 @@ class ProfileIdentityManager(BaseManager):
             self._session.rollback()
             return error_res(f"Error occured setting active identities")
     
+    def get_dashboard_identities(self, profile_id) -> dict:
+        """
+        Gets all of a user's identities with their projects and tasks.
+
+        The dashboard walks every identity, project, and task. Loading
+        them here with 'selectinload' takes three queries in total,
+        instead of one per identity and one per project.
+
+        Args:
+            profile_id (int): The primary key of the user's profile.
+
+        Returns:
+            dict: A standardized response. On success, the payload
+                    contains the 'identities' list.
+        """
+        if not profile_id:
+            return error_res("Missing profile...")
+
+        query = select(ProfileIdentity).where(
+            ProfileIdentity.profile_id == profile_id
+        ).order_by(ProfileIdentity.id).options(
+            selectinload(ProfileIdentity.projects).selectinload(Project.tasks)
+        )
+
+        try:
+            identities = self._session.scalars(query).all()
+            return success_res(payload={ "identities": identities }, msg="Identities found...")
+        except SQLAlchemyError:
+            current_app.logger.exception("get_dashboard_identities failed for profile %s", profile_id)
+            return error_res("Error getting identities...")
+
     def get_active_identity(self, profile) -> dict:
         """
         Finds and returns the currently active ProfileIdentity for a user.
@@ -208,8 +244,7 @@ class ProfileIdentityManager(BaseManager):
         """
         Sets 'is_active' to False for all of a user's identities.
 
-        This is a helper method for 'set_identity' to ensure only
-        one identity can be active at a time.
+        Used to clear the active identity before a new one is chosen.
 
         Args:
             profile (Profile): The user's Profile object.
@@ -220,13 +255,19 @@ class ProfileIdentityManager(BaseManager):
         if not profile:
             return error_res("Profile not given.")
         
+        # One 'UPDATE ... WHERE' for all of the user's identities, instead
+        # of loading 'profile.identities' and flushing one UPDATE per row.
+        # 'evaluate' applies the change to any of them already in the session.
+        stmt = update(ProfileIdentity).where(
+            ProfileIdentity.profile_id == profile.id,
+            ProfileIdentity.is_active.is_(True)
+        ).values(is_active=False)
+
         try:
-            # Stage all identities to be deactivated
-            for identity in profile.identities:
-                identity.is_active = False
-                self._session.add(identity)
+            self._session.execute(stmt, execution_options={ "synchronize_session": "evaluate" })
             # Commit all changes in one transaction
             self._session.commit()
+            self._evict_model(ProfileIdentity)
             return success_res(payload={}, msg="Identities deactivated.")
         except Exception as e:
             self._session.rollback()
@@ -236,9 +277,9 @@ class ProfileIdentityManager(BaseManager):
         """
         Sets a specific identity as active for a user.
 
-        This performs an atomic-like transaction:
-        1. Calls 'deactivate_identities' (which commits).
-        2. Activates the one specified by 'identity_id' (and commits).
+        A single 'UPDATE' sets 'is_active' on all of the user's identities
+        at once: True for 'identity_id' and False for the rest. The switch
+        is atomic, so there is no moment where no identity is active.
 
         Args:
             profile (Profile): The user's Profile object.
@@ -249,27 +290,24 @@ class ProfileIdentityManager(BaseManager):
         """
         identity: ProfileIdentity | None = self._session.get(ProfileIdentity, identity_id)
 
-        # Return an error res if the identity wasnt found
-        if not identity:
+        # Return an error res if the identity wasnt found (or isn't the user's)
+        if not identity or identity.profile_id != profile.id:
             return error_res("Identity not found.")
 
-        # Deactivate all and set new one to active
+        stmt = update(ProfileIdentity).where(
+            ProfileIdentity.profile_id == profile.id
+        ).values(
+            is_active=case((ProfileIdentity.id == identity.id, True), else_=False)
+        )
+
         try:
-            # --- 1. Deactivate all existing identities ---
-            deactivate_res = self.deactivate_identities(profile)
-            if not deactivate_res.get("success"):
-                # If this fails, we can't proceed.
-                return error_res(deactivate_res.get("msg", ""))
-
-            # --- 2. Activate the new identity ---
-            identity.is_active = True
-            self._session.add(identity)
+            # 'evaluate' applies the new flags to any identities already in the session
+            self._session.execute(stmt, execution_options={ "synchronize_session": "evaluate" })
             self._session.commit()
+            self._evict_model(ProfileIdentity)
             return success_res(payload={ "active_identity": identity }, msg="Identity set")
         except Exception as e:
-            # Note: The 'deactivate_identities' call already committed.
-            # A rollback here will only roll back the 'set_identity' part.
-            # This is acceptable, as it just means no identity is active.
+            # Nothing was committed, so the previous identity stays active
             self._session.rollback()
             return error_res(f"Error setting new active identity. Error: {e}")
     
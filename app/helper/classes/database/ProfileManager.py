@@ -14,7 +14,10 @@ from bcrypt import checkpw, hashpw, gensalt
 from app.helper.functions.response_schemas import success_res, error_res
 from string import punctuation
 from datetime import datetime
-from flask import Flask, current_app
+from flask import g
+
+# Set of accepted symbols, built once so each check is a set lookup rather than a string scan.
+_SYMBOLS: frozenset = frozenset(punctuation)
 
 class PasswordManager:
     """
@@ -24,8 +27,6 @@ class PasswordManager:
     from the Flask app config and provides methods to hash, verify,
     and check passwords against those rules.
     """
-    _CONFIG: dict = {}
-
     def __init__(self, config) -> None:
         """
         Initializes the PasswordManager.
@@ -35,6 +36,12 @@ class PasswordManager:
         """
         self._CONFIG: dict = config
 
+        # Resolve the complexity rules once; they are fixed for the life of the app.
+        self._min_len: int = config.get("PASSWORD_MIN_LENGTH", 8)
+        self._max_len: int = config.get("PASSWORD_MAX_LENGTH", 128)
+        self._needs_cap: bool = config.get("PASSWORD_CONTAINS_CAP", True)
+        self._needs_symbol: bool = config.get("PASSWORD_CONTAINS_SYMBOL", True)
+
     def check_len(self, password: str) -> bool:
         """
         Checks if a password meets the configured length requirements.
@@ -45,10 +52,7 @@ class PasswordManager:
         Returns:
             bool: True if the password length is valid, False otherwise.
         """
-        pw_len: int = len(password.strip())
-        min_len: int = self._CONFIG.get("PASSWORD_MIN_LENGTH", 8)
-        max_len: int = self._CONFIG.get("PASSWORD_MAX_LENGTH", 128)
-        return pw_len >= min_len and pw_len <= max_len
+        return self._min_len <= len(password.strip()) <= self._max_len
 
     def check_cap(self, password: str) -> bool:
         """
@@ -61,10 +65,9 @@ class PasswordManager:
             bool: True if the password meets the capital letter requirement, 
                   False otherwise.
         """
-        needs_cap: bool = self._CONFIG.get("PASSWORD_CONTAINS_CAP", True)
         # If the rule is disabled, always return True.
         # Otherwise, check if any character in the password is uppercase.
-        return True if not needs_cap else any(c.isupper() for c in password)
+        return True if not self._needs_cap else any(c.isupper() for c in password)
     
     def check_complexity(self, password: str):
         """
@@ -77,10 +80,9 @@ class PasswordManager:
             bool: True if the password meets the symbol requirement, 
                   False otherwise.
         """
-        needs_symbol = self._CONFIG.get("PASSWORD_CONTAINS_SYMBOL", True)
         # If the rule is disabled, always return True.
-        # Otherwise, check if any character is in the 'punctuation' string.
-        return True if not needs_symbol else any(c in punctuation for c in password)
+        # Otherwise, check if the password shares any character with the symbol set.
+        return True if not self._needs_symbol else not _SYMBOLS.isdisjoint(password)
 
     def verify(self, pw_challenge_hash: str, pw_attempt_string: str) -> bool:
         """
@@ -114,12 +116,12 @@ class PasswordManager:
     @property
     def min_pw_length(self):
         """Property to expose the min password length from config."""
-        return self._CONFIG.get("PASSWORD_MIN_LENGTH", 8)
+        return self._min_len
     
     @property
     def max_pw_length(self):
         """Property to expose the max password length from config."""
-        return self._CONFIG.get("PASSWORD_MAX_LENGTH", 128)
+        return self._max_len
     
 class ProfileValidator:
     """
@@ -147,6 +149,8 @@ class ProfileManager(BaseManager):
     and profile updates (update_profile, change_password, delete_account).
     It uses the PasswordManager for all password-related tasks.
     """
+    __slots__ = ("pw_manager",)
+
     def __init__(self, db_manager_instance, pw_manager) -> None:
         """
         Initializes the ProfileManager.
@@ -262,17 +266,46 @@ class ProfileManager(BaseManager):
         Retrieves a single profile from the DB using their primary key ID.
         Used by Flask-Login's user_loader.
 
+        Uses 'session.get()', which checks the session's identity map
+        first, so a profile already loaded in this request is returned
+        without any SQL.
+
         Args:
-            id (int): The profile's primary key.
+            id (int | str): The profile's primary key. Flask-Login passes
+                            it as a string, so it is converted first.
 
         Returns:
-            dict: A standardized response from read_item().
+            dict: A standardized success or error response dictionary.
         """
-        return self.read_item(
-            model=Profile,
-            item_name="Profile",
-            id=id,
-        )
+        try:
+            # The identity map is keyed by the int primary key
+            profile = self._session.get(Profile, int(id))
+        except (TypeError, ValueError):
+            return error_res(msg="Invalid profile ID")
+
+        if not profile:
+            return error_res(msg="Profile not found")
+
+        return success_res(payload={ "profile": profile }, msg="Profile found")
+
+    def invalidate(self, profile_id: int, email: str = None) -> None:
+        """
+        Drops any cached lookups for a profile after it has been changed.
+
+        Clears the request cache entry used by get_profile_by_email, as
+        well as the profile memoised by the user_loader, so later reads
+        see fresh data.
+
+        Args:
+            profile_id (int): The profile's primary key.
+            email (str, optional): The email the profile was cached under.
+        """
+        if email:
+            self.evict(Profile, email=email)
+
+        loaded_user = g.get("_loaded_user")
+        if loaded_user and loaded_user[0] == profile_id:
+            g.pop("_loaded_user")
 
     def create_profile(self, **profile_data) -> dict:
         """
@@ -435,6 +468,9 @@ class ProfileManager(BaseManager):
         """
         if not profile:
             return error_res("No profile given.")
+
+        # Keep the current email so its cache entry can be dropped if it changes
+        old_email = profile.email
         
         # Iterate over all provided data
         for key, value in profile_data.items():
@@ -447,6 +483,7 @@ class ProfileManager(BaseManager):
             # Add the modified instance to the session and commit
             self._session.add(profile)
             self._session.commit()
+            self.invalidate(profile.id, old_email)
             return success_res(payload={}, msg="Settings saved!")
         except Exception as e:
             self._session.rollback()
@@ -482,6 +519,7 @@ class ProfileManager(BaseManager):
             profile.password = self.pw_manager.hashpw(new_password).decode('utf-8')
             self._session.add(profile)
             self._session.commit()
+            self.invalidate(profile.id, profile.email)
             return success_res(payload={}, msg="Password updated!")
 
         except Exception as e:
@@ -492,8 +530,9 @@ class ProfileManager(BaseManager):
         """
         Permanently deletes a user's account and all associated data.
 
-        Note: Associated data (projects, tasks, etc.) is deleted via
-        'cascade="all, delete-orphan"' set on the Profile model relationships.
+        Note: Associated data (projects, tasks, etc.) is deleted by the
+        database through the foreign keys' 'ON DELETE CASCADE' (the Profile
+        relationships use 'passive_deletes=True').
 
         Args:
             profile (Profile): The SQLAlchemy Profile model instance to delete.
@@ -505,12 +544,14 @@ class ProfileManager(BaseManager):
             return error_res("No profile given.")
 
         try:
-            # Store email to verify deletion after commit
+            # Store email and ID to verify deletion after commit
             email = profile.email
+            profile_id = profile.id
             
             # --- 1. Delete from session ---
             self._session.delete(profile)
             self._session.commit()
+            self.invalidate(profile_id, email)
 
             # --- 2. Verify deletion ---
             check_res = self.get_profile_by_email(email)
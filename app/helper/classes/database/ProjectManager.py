@@ -8,11 +8,11 @@ and handling the 'active' project for a given identity.
 """
 
 from .BaseManager import BaseManager
-from .ProfileIdentityManager import ProfileIdentityManager
-from app.database.models import Project, Status
+from app.database.models import Project, ProjectStats, Status, Task
 from app.helper.functions.response_schemas import success_res, error_res
 from datetime import date, timedelta, datetime
-from sqlalchemy import select
+from flask import g
+from sqlalchemy import select, func, case
 
 class ProjectManager(BaseManager):
     """
@@ -21,6 +21,8 @@ class ProjectManager(BaseManager):
     Inherits from BaseManager to get access to the session, cache,
     and generic helper methods.
     """
+    __slots__ = ()
+
     def __init__(self, db_manager_instance) -> None:
         """
         Initializes the ProjectManager.
@@ -262,7 +264,7 @@ class ProjectManager(BaseManager):
         query = select(Project).where(
             Project.owner_id == profile_id,
             Project.identity_id == identity_id
-        )
+        ).options(*self._list_options())
 
         # Check for a status key and add it to the query
         if status_key and status_key != "all":
@@ -278,19 +280,55 @@ class ProjectManager(BaseManager):
         try:
             # Get all projects matching the query
             projects = self._session.scalars(query).all()
+
+            # Aggregate the task counters for every listed project at once
+            self.load_project_stats([project.id for project in projects])
             return success_res(msg="Projects found!", payload={ "projects": projects })
 
         except Exception as e:
             return error_res(f"Error getting projects. Error {e}")
     
+    def load_project_stats(self, project_ids) -> dict:
+        """
+        Loads the task counts for a set of projects into 'g.project_stats'.
+
+        Runs one GROUP BY over the tasks table instead of loading each
+        project's Task rows. The 'Project' task counters read these
+        'ProjectStats' for the rest of the request.
+
+        Args:
+            project_ids (list[int]): The primary keys of the projects.
+
+        Returns:
+            dict: The 'ProjectStats' keyed by project ID.
+        """
+        if not project_ids:
+            return {}
+
+        query = select(
+            Task.project_id,
+            func.count().label("total"),
+            func.sum(case((Task.is_complete, 1), else_=0)).label("done")
+        ).where(
+            Task.project_id.in_(project_ids)
+        ).group_by(Task.project_id)
+
+        # Projects without any tasks don't appear in the GROUP BY
+        stats = {project_id: ProjectStats() for project_id in project_ids}
+        for project_id, total, done in self._session.execute(query):
+            stats[project_id] = ProjectStats(total=total, done=done or 0)
+
+        g.project_stats = {**g.get("project_stats", {}), **stats}
+        return stats
+
     def update_project_status(self, project_id) -> dict:
         """
         Recalculates and updates a project's status based on its tasks.
 
-        This method is designed to be called *within* another transaction
-        (like when a task is created or updated). It adds the change to the
-        session but does NOT commit it. The calling function is responsible
-        for the final commit or rollback.
+        This method is designed to be called inside another manager's
+        'transaction()' block (like when a task is created or updated). It
+        only flushes the change; a database error is raised so the block
+        rolls back the whole transaction.
 
         Args:
             project_id (int): The ID of the project to update.
@@ -311,21 +349,16 @@ class ProjectManager(BaseManager):
         # --- This is the core business logic for project status ---
         if total_task_count == 0:
             # No tasks = Not Started
-            project.status = Status.NOT_STARTED.value
+            status = Status.NOT_STARTED.value
         elif all(task.is_complete for task in tasks):
             # All tasks complete = Completed
-            project.status = Status.COMPLETED.value
+            status = Status.COMPLETED.value
         else:
             # Any other state (some tasks complete, none complete) = In Progress
-            project.status = Status.IN_PROGRESS.value
-        
-        try:
-            # Stage the change to the session.
-            self._session.add(project)
-            return success_res(msg="Project status updated!", payload={})
-        except Exception as e:
-            # We don't rollback here, as we're part of a larger transaction.
-            return error_res(f"Error updating project status. Error: {e}")
+            status = Status.IN_PROGRESS.value
+
+        # Stage the change in the caller's transaction (no commit, no rollback)
+        return self.update_item(project, "Project", "Project status updated!", commit=False, status=status)
     
     def deactivate_projects(self, identity):
         """
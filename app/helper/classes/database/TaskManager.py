@@ -9,10 +9,12 @@ updated whenever one of its tasks is modified (an atomic transaction).
 
 from .BaseManager import BaseManager
 from .ProjectManager import ProjectManager
-from app.database.models import Task, Difficulty, Project
+from app.database.models import Task, Difficulty
 from app.helper.functions.response_schemas import success_res, error_res
 from datetime import date, timedelta, datetime
+from flask import current_app
 from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 
 class TaskManager(BaseManager):
     """
@@ -22,6 +24,8 @@ class TaskManager(BaseManager):
     status change) are reflected in the parent project's overall status
     within a single, atomic database transaction.
     """
+    __slots__ = ()
+
     def __init__(self, db_manager_instance) -> None:
         """
         Initializes the TaskManager.
@@ -81,33 +85,30 @@ class TaskManager(BaseManager):
 
         # --- 3. Begin Atomic Transaction ---
         try:
-            # Create the Task object
-            task: Task = Task(**task_data)
-            self._session.add(task)
-            
-            # Flush the session to add the task, but don't commit yet.
-            # This makes the task available for the project status update.
-            self._session.flush()
+            with self.transaction():
+                # Create the Task object. 'commit=False' only flushes, which
+                # makes the task available for the project status update.
+                self.create_item(Task(**task_data), "Task created!", "Task", commit=False)
 
-            # Call the ProjectManager to update the project's status
-            # This stages the project update in the *same* transaction.
-            project_update_res: dict = project_manager.update_project_status(project_id=project_id)
+                # Call the ProjectManager to update the project's status
+                # This stages the project update in the *same* transaction.
+                project_update_res: dict = project_manager.update_project_status(project_id=project_id)
 
-            # If the project update failed, we must roll back the task creation
-            if not project_update_res.get("success"):
-                # Raise a value error to trigger the rollback
-                raise ValueError(f"Error updating project. {project_update_res.get("msg", "")}")
+                # If the project update failed, we must roll back the task creation
+                if not project_update_res.get("success"):
+                    # Raise a value error to trigger the rollback
+                    raise ValueError(f"Error updating project. {project_update_res.get("msg", "")}")
 
-            # Both operations succeeded, commit the transaction.
-            self._session.commit()
+            # Both operations succeeded and the transaction was committed
             return success_res(msg="Task created!", payload={})
         
-        except Exception as e:
-            # If anything fails (task creation or project update),
-            # roll back the entire transaction.
-            self._session.rollback()
-            # Note: A small bug here, error message refers to 'editing'
-            return error_res(f"Error creating task. Error: {e}")
+        except ValueError as e:
+            return error_res(f"Error creating task. {e}")
+
+        except SQLAlchemyError:
+            # The transaction rolled back both the task and the project update
+            current_app.logger.exception("Failed to create task")
+            return error_res("Error creating task due to a database error...")
 
     def edit_task(self, task_id, **raw_data):
         """
@@ -196,26 +197,27 @@ class TaskManager(BaseManager):
         
         try:
             # --- 1. Begin Atomic Transaction ---
-            self._session.delete(task)
-            
-            # Flush the session to register the deletion
-            self._session.flush()
-            
-            # --- 2. Update Project Status ---
-            # Recalculate the project's status *without* this task
-            project_update_res = project_manager.update_project_status(task.project_id)
-
-            if not project_update_res.get("success", False):
-                # If project update fails, roll back the task deletion
-                raise ValueError("Error updating projects")
-            
-            # --- 3. Commit Transaction ---
-            self._session.commit()
+            with self.transaction():
+                # Delete and flush to register the deletion
+                self.delete_item(task, "Task", "Task deleted...", commit=False)
+
+                # --- 2. Update Project Status ---
+                # Recalculate the project's status *without* this task
+                project_update_res = project_manager.update_project_status(task.project_id)
+
+                if not project_update_res.get("success", False):
+                    # If project update fails, roll back the task deletion
+                    raise ValueError("Error updating projects")
+
+            # --- 3. Transaction committed on leaving the block ---
             return success_res(msg="Task deleted...", payload={})
         
-        except Exception as e:
-            self._session.rollback()
-            return error_res(f"Error deleting task. Error: {e}")
+        except ValueError as e:
+            return error_res(f"Error deleting task. {e}")
+
+        except SQLAlchemyError:
+            current_app.logger.exception("Failed to delete task %s", task_id)
+            return error_res("Error deleting task due to a database error...")
 
     def get_project_tasks(self, project_id):
         """
@@ -234,7 +236,7 @@ class TaskManager(BaseManager):
             # Build the query
             query = select(Task).where(
                 Task.project_id == project_id
-            ).order_by(Task.due_date.asc())
+            ).options(*self._list_options()).order_by(Task.due_date.asc())
 
             tasks = self._session.scalars(query).all()
 
@@ -258,7 +260,7 @@ class TaskManager(BaseManager):
             return error_res("Project not given")
 
         # Start with the base query
-        query = select(Task).where(Task.project_id == project_id)
+        query = select(Task).where(Task.project_id == project_id).options(*self._list_options())
 
         # Add the difficulty filter if a valid one is provided
         if difficulty_key and difficulty_key != "all":
@@ -319,25 +321,24 @@ class TaskManager(BaseManager):
         
         try:
             # --- 1. Begin Atomic Transaction ---
-            # Toggle the 'is_complete' status
-            task.is_complete = True if not task.is_complete else False
-            self._session.add(task)
-            
-            # Flush the session to register the change
-            self._session.flush()
-
-            # --- 2. Update Project Status ---
-            # Recalculate the project's status with the new task status
-            project_update_res = project_manager.update_project_status(task.project_id)
-
-            if not project_update_res.get("success", False):
-                # If project update fails, roll back the task status change
-                raise ValueError("Error updating projects")
-            
-            # --- 3. Commit Transaction ---
-            self._session.commit()
+            with self.transaction():
+                # Toggle the 'is_complete' status and flush to register the change
+                self.update_item(task, "Task", "Task updated!", commit=False, is_complete=not task.is_complete)
+
+                # --- 2. Update Project Status ---
+                # Recalculate the project's status with the new task status
+                project_update_res = project_manager.update_project_status(task.project_id)
+
+                if not project_update_res.get("success", False):
+                    # If project update fails, roll back the task status change
+                    raise ValueError("Error updating projects")
+
+            # --- 3. Transaction committed on leaving the block ---
             return success_res(msg="Task updated!", payload={})
         
-        except Exception as e:
-            self._session.rollback()
-            return error_res(f"Error updating task status tasks. Error {e}")
+        except ValueError as e:
+            return error_res(f"Error updating task status. {e}")
+
+        except SQLAlchemyError:
+            current_app.logger.exception("Failed to update status of task %s", task_id)
+            return error_res("Error updating task status due to a database error...")
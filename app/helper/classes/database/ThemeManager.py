@@ -8,7 +8,10 @@ creating, retrieving, and seeding the application's color themes.
 from .BaseManager import BaseManager
 from app.database.models import Theme
 from app.helper.functions.response_schemas import success_res, error_res
+from flask import current_app
 from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from types import MappingProxyType
 
 class ThemeManager(BaseManager):
     """
@@ -17,6 +20,9 @@ class ThemeManager(BaseManager):
     Inherits from BaseManager to get access to the session, cache,
     and generic helper methods.
     """
+    __slots__ = ()
+
+    _HUE_COLUMNS: tuple = ("primary_hue", "secondary_hue", "tertiary_hue", "neutral_hue", "text_hue")
     
     def get_by_name(self, theme_name):
         """
@@ -42,19 +48,42 @@ class ThemeManager(BaseManager):
             theme_id (int): The ID of the theme to find.
 
         Returns:
-            dict: A standardized success or error response from read_item().
+            dict: A standardized success or error response from read_by_pk().
         """
-        return self.read_item(
+        return self.read_by_pk(
             model=Theme,
             item_name="Theme",
-            id=theme_id,
+            pk=theme_id,
         )
     
+    def get_hues(self, theme_id):
+        """
+        Retrieves a theme's hue values.
+
+        This is called by the base template on every page render. The
+        theme is read through 'read_item()', so it comes from Theme's
+        shared TTL cache (see 'shared_cache_ttl' in models.py) rather
+        than the database on most renders.
+
+        Args:
+            theme_id (int): The ID of the theme.
+
+        Returns:
+            MappingProxyType | None: The theme's hue values by column name,
+                                     or None if the theme doesn't exist.
+        """
+        theme_res = self.read_item(model=Theme, item_name="Theme", id=theme_id)
+        if not theme_res.get("success"):
+            return None
+
+        theme = theme_res["payload"]["theme"]
+        return MappingProxyType({ column: getattr(theme, column) for column in self._HUE_COLUMNS })
+
     def create_theme(self, **theme_kwargs):
         """
         Creates a new theme in the database.
 
-        Checks for duplicates based on theme name before creation.
+        Checks for duplicates based on theme name in the same statement.
 
         Args:
             **theme_kwargs: Keyword arguments for the new Theme model.
@@ -65,20 +94,14 @@ class ThemeManager(BaseManager):
         # Sanitize the name
         theme_kwargs["name"] = theme_kwargs.get("name", "").strip()
 
-        # Check for duplicates
-        is_duplicate = self.get_by_name(theme_kwargs["name"]).get("success")
-
-        if is_duplicate:
-            return error_res(f"Theme already created.")
-
-        # Create the new Theme object
-        theme = Theme(**theme_kwargs)
-
-        # Use the BaseManager's create_item method
-        return self.create_item(
-            item=theme,
-            success_msg="New theme created",
+        # Check for duplicates and insert in one statement
+        return self.create_if_not_exists(
+            model=Theme,
             item_name="Theme",
+            success_msg="New theme created",
+            duplicate_msg="Theme already created.",
+            unique_cols=("name",),
+            **theme_kwargs
         )
     
     def get_default(self):
@@ -118,8 +141,9 @@ class ThemeManager(BaseManager):
             else:
                 return success_res(payload={ "themes": themes }, msg="Themes found...")
         
-        except Exception as e:
-            return error_res(f"An error occurred retrieving themes: {e}")
+        except SQLAlchemyError:
+            current_app.logger.exception("Failed to retrieve themes")
+            return error_res("An error occurred retrieving themes")
 
 
     def init(self, theme_data):
@@ -127,7 +151,8 @@ class ThemeManager(BaseManager):
         Initializes the database with a list of themes from a seed file.
 
         This method is called by the 'flask seed-db' command. It performs
-        a bulk insert of theme data.
+        a single bulk insert of the theme data via 'create_items()',
+        skipping any theme whose name is already in the table.
 
         Args:
             theme_data (list[dict]): A list of dictionaries, where each
@@ -136,19 +161,12 @@ class ThemeManager(BaseManager):
         Returns:
             dict: A standardized success or error response dictionary.
         """
-        themes_to_add = []
-        try:
-            # Create a list of Theme objects from the provided data
-            for theme in theme_data:
-                new_theme = Theme(**theme)
-                themes_to_add.append(new_theme)
-
-            # Add all new themes to the session and commit at once
-            self._session.add_all(themes_to_add)
-            self._session.commit()
-
-        except Exception as e:
-            self._session.rollback()
-            return error_res(f"Failed to create theme. Error raised: {e}")
-
-        return success_res(payload={ "themes": themes_to_add }, msg="Themes created...")
\ No newline at end of file
+        # Themes whose name already exists are skipped (like the identity
+        # template seed), so one duplicate doesn't fail the whole batch
+        return self.create_items(
+            model=Theme,
+            items=theme_data,
+            stmt=self._insert_ignore(Theme, ("name",)),
+            success_msg="Themes created...",
+            item_name="Theme",
+        )
\ No newline at end of file
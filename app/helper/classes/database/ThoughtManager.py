@@ -9,7 +9,6 @@ It includes the logic for the filterable "Timeline" feature.
 from .BaseManager import BaseManager
 from app.database.models import Thought, Profile, ProfileIdentity
 from app.helper.functions.response_schemas import success_res, error_res
-from flask import Flask, current_app
 from sqlalchemy import select, extract, cast, Date
 from datetime import datetime, timezone
 
@@ -20,6 +19,8 @@ class ThoughtManager(BaseManager):
     Inherits from BaseManager to get access to the session, cache,
     and generic helper methods.
     """
+    __slots__ = ()
+
     def __init__(self, db_manager_instance) -> None:
         """
         Initializes the ThoughtManager.
@@ -104,7 +105,7 @@ class ThoughtManager(BaseManager):
         # SELECT * FROM thoughts WHERE profile_identity_id = ?
         query = select(Thought).where(
             Thought.profile_identity_id == identity_id
-        )
+        ).options(*self._list_options())
         
         year = filter_kwargs.get("year")
         month = filter_kwargs.get("month")
@@ -12,6 +12,10 @@ from wtforms.validators import DataRequired, Length, Optional
 from datetime import date, timedelta
 from app.database.models import Difficulty
 
+def _in_thirty_days() -> date:
+    """Returns the date 30 days from today (the default end/due date)."""
+    return date.today() + timedelta(days=30)
+
 class CreateThoughtForm(FlaskForm):
     """
     Form for creating a new thought on the Thoughts page.
@@ -82,7 +86,7 @@ class CreateProjectForm(FlaskForm):
         validators=[
             DataRequired("Enter a start date")
         ],
-        default=date.today() # Defaults to the current date.
+        default=date.today # Called per form, so it's always the current date.
     )
 
     project_end_date = DateField(
@@ -90,7 +94,7 @@ class CreateProjectForm(FlaskForm):
         validators=[
             DataRequired("Enter an end date"),
         ],
-        default=timedelta(days=30) + date.today() # Defaults to 30 days from now.
+        default=_in_thirty_days # Defaults to 30 days from now.
     )
 
     submit_project = SubmitField("Create Project")
@@ -110,7 +114,7 @@ class CreateTaskForm(FlaskForm):
         validators=[
             DataRequired("Enter a start date")
         ],
-        default=timedelta(days=30) + date.today()
+        default=_in_thirty_days
     )
 
     task_difficulty = RadioField(
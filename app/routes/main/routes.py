@@ -48,7 +48,14 @@ def home():
     It then renders the 'home.html' template with this processed data.
     """
     user_logged_in: Profile = current_user 
-    identities: List[ProfileIdentity] = user_logged_in.identities
+    profile_identity_manager: ProfileIdentityManager = current_app.db_manager.profile_identity
+
+    # Identities, projects, and tasks are loaded up front in three queries
+    identities_res = profile_identity_manager.get_dashboard_identities(user_logged_in.id)
+    if not identities_res.get("success"):
+        abort(500) # Don't render an empty dashboard over a database error
+
+    identities: List[ProfileIdentity] = identities_res.get("payload", {}).get("identities", [])
 
     # --- 1. Initialize data structures for widgets ---
     identity_widget_data = []
@@ -184,7 +191,6 @@ def projects():
     # --- 4. Handle POST Requests (Form Submissions) ---
     
     # Check if the "Create Project" form was submitted
-    print(create_project_form.submit_project.data)
     if create_project_form.submit_project.data and create_project_form.validate_on_submit():
         project_data = {
             "name": create_project_form.project_name.data,
@@ -0,0 +1,47 @@
+"""Server-side created_at timestamps
+
+Revision ID: 5c1e9a7d3b42
+Revises: 12f7a77b262d
+Create Date: 2026-10-15 10:12:41.218734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1e9a7d3b42'
+down_revision = '12f7a77b262d'
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs holding a creation timestamp.
+TIMESTAMP_COLUMNS = [
+    ('identity_templates', 'created_at'),
+    ('profiles', 'created_at'),
+    ('profile_identities', 'identity_created_at'),
+    ('projects', 'created_at'),
+    ('thoughts', 'created_at'),
+    ('tasks', 'created_at'),
+]
+
+
+def upgrade():
+    # Existing values were written as naive UTC, so convert them as UTC.
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column,
+               existing_type=sa.DateTime(),
+               type_=sa.DateTime(timezone=True),
+               server_default=sa.text('now()'),
+               existing_nullable=False,
+               postgresql_using=f"{column} AT TIME ZONE 'UTC'")
+
+
+def downgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column,
+               existing_type=sa.DateTime(timezone=True),
+               type_=sa.DateTime(),
+               server_default=None,
+               existing_nullable=False,
+               postgresql_using=f"{column} AT TIME ZONE 'UTC'")
@@ -0,0 +1,42 @@
+"""ON DELETE CASCADE foreign keys
+
+Revision ID: 8a4f2c6e1d90
+Revises: 5c1e9a7d3b42
+Create Date: 2026-10-15 10:41:07.904512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a4f2c6e1d90'
+down_revision = '5c1e9a7d3b42'
+branch_labels = None
+depends_on = None
+
+# (table, column, referred table) for each child-to-parent foreign key.
+# The initial migration left them unnamed, so they carry PostgreSQL's
+# default '<table>_<column>_fkey' names.
+CASCADE_FOREIGN_KEYS = [
+    ('profile_identities', 'profile_id', 'profiles'),
+    ('projects', 'owner_id', 'profiles'),
+    ('projects', 'identity_id', 'profile_identities'),
+    ('thoughts', 'profile_id', 'profiles'),
+    ('thoughts', 'profile_identity_id', 'profile_identities'),
+    ('tasks', 'project_id', 'projects'),
+]
+
+
+def upgrade():
+    for table, column, referred_table in CASCADE_FOREIGN_KEYS:
+        constraint_name = f'{table}_{column}_fkey'
+        op.drop_constraint(constraint_name, table, type_='foreignkey')
+        op.create_foreign_key(constraint_name, table, referred_table, [column], ['id'], ondelete='CASCADE')
+
+
+def downgrade():
+    for table, column, referred_table in CASCADE_FOREIGN_KEYS:
+        constraint_name = f'{table}_{column}_fkey'
+        op.drop_constraint(constraint_name, table, type_='foreignkey')
+        op.create_foreign_key(constraint_name, table, referred_table, [column], ['id'])
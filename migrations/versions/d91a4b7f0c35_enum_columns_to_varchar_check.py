@@ -0,0 +1,50 @@
+"""Store project status and task difficulty as VARCHAR + CHECK
+
+Revision ID: d91a4b7f0c35
+Revises: b37d0e58c214
+Create Date: 2026-10-15 11:38:20.447915
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd91a4b7f0c35'
+down_revision = 'b37d0e58c214'
+branch_labels = None
+depends_on = None
+
+# (table, column, native enum type, CHECK constraint name, allowed values)
+ENUM_COLUMNS = [
+    ('projects', 'status', 'status', 'ck_projects_status', ('not_started', 'in_progress', 'completed')),
+    ('tasks', 'difficulty', 'difficulty', 'ck_tasks_difficulty', ('easy', 'medium', 'hard')),
+]
+
+
+def upgrade():
+    for table, column, type_name, constraint_name, values in ENUM_COLUMNS:
+        op.alter_column(table, column,
+               existing_type=sa.Enum(*values, name=type_name),
+               type_=sa.String(length=16),
+               existing_nullable=False,
+               postgresql_using=f'{column}::text')
+        allowed = ", ".join(f"'{value}'" for value in values)
+        op.create_check_constraint(constraint_name, table, f'{column} IN ({allowed})')
+        sa.Enum(*values, name=type_name).drop(op.get_bind(), checkfirst=True)
+
+    op.create_index('ix_projects_status', 'projects', ['status'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_projects_status', table_name='projects')
+
+    for table, column, type_name, constraint_name, values in ENUM_COLUMNS:
+        enum_type = sa.Enum(*values, name=type_name)
+        enum_type.create(op.get_bind(), checkfirst=True)
+        op.drop_constraint(constraint_name, table, type_='check')
+        op.alter_column(table, column,
+               existing_type=sa.String(length=16),
+               type_=enum_type,
+               existing_nullable=False,
+               postgresql_using=f'{column}::{type_name}')
@@ -19,9 +19,12 @@ Or use the Flask CLI (which also uses this file):
 
 import os
 from app import create_app, db
+from app.config import load_env
 
 # 1. Get the configuration key from the environment variables.
+# The .env file is loaded first so FLASK_CONFIG can be set there.
 # This defaults to 'default' if FLASK_CONFIG is not set.
+load_env()
 config_key = os.environ.get("FLASK_CONFIG", "default")
 
 # 2. Create the Flask application instance